@@ -17,6 +17,9 @@ Usage:
     python aggregate_results.py --results-dir ./county_results --output statewide_results.json
 """
 
+import functools
+import hashlib
+import heapq
 import json
 import os
 import re
@@ -24,25 +27,77 @@ import argparse
 import subprocess
 import sys
 from pathlib import Path
-from typing import Dict, List, Tuple
-from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import openpyxl
+
+try:
+    import orjson  # Optional: much faster JSON encode/decode
+except ImportError:
+    orjson = None
+
+
+# Keywords that identify each multi-county race type, checked with plain
+# substring tests against the upper-cased contest name. Race types are tried
+# in order, so "REPRESENTATIVE IN CONGRESS" is Congress rather than State
+# House; the district is the first number after the matching keyword.
+RACE_KEYWORDS = {
+    'congress': ('CONGRESS', 'U.S. REPRESENTATIVE'),
+    'state_senate': ('STATE SENATE', 'SENATOR', 'SENATE DISTRICT'),
+    'state_house': ('REPRESENTATIVE', 'HOUSE DISTRICT', 'STATE HOUSE'),
+}
+_DIGITS_RE = re.compile(r'\d+')
+
+# A contest found in at least this many counties is treated as statewide
+MIN_STATEWIDE_COUNTIES = 5
+
+# Keep only the top N candidates per merged contest (None keeps everyone).
+# Total votes and percentages always cover every candidate.
+TOP_K = None
+
+# Contest-name variations collapsed to a common form before matching
+CONTEST_ALIASES = {
+    'PRESIDENT OF THE UNITED STATES': 'PRESIDENT',
+    'U.S. SENATOR': 'SENATOR',
+    'U.S. REPRESENTATIVE': 'REPRESENTATIVE',
+}
+_CONTEST_ALIAS_RE = re.compile('|'.join(re.escape(alias) for alias in CONTEST_ALIASES))
+
+# Parsed race mappings are cached here unless a cache_dir is given. Bump
+# _MAPPINGS_CACHE_VERSION whenever _load_race_mappings' output changes so a
+# cache written by an older version is parsed again instead of served.
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / '.cache' / 'aggregate'
+_MAPPINGS_CACHE_VERSION = 1
+
+_PARTY_SUFFIX_RE = re.compile(r'\s*\([A-Z]+\)\s*')
+_WS_RE = re.compile(r'\s+')
+_NO_WS = str.maketrans('', '', ' \t')
 
 
 class MultiCountyAggregator:
     """Aggregates election results from multiple Illinois counties."""
     
-    def __init__(self, results_dir: str, races_file: str = None):
+    def __init__(self, results_dir: str, races_file: str = None, embed_counties: bool = False,
+                 cache_dir: Optional[str] = None):
         """
         Initialize aggregator.
         
         Args:
             results_dir: Directory containing county JSON result files
             races_file: Path to Excel file with multi-county race mappings
+            embed_counties: Embed full raw county data in the output instead of
+                            referencing each county's result file
+            cache_dir: Where parsed race mappings are cached (default:
+                       .cache/aggregate next to this script)
         """
         self.results_dir = Path(results_dir)
         self.races_file = races_file or "/mnt/project/2026_races.xlsx"
+        self.embed_counties = embed_counties
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        
+        # County name → source file, filled in by _load_county_results
+        self.county_files = {}
         
         # Load multi-county race mappings
         self.race_mappings = self._load_race_mappings()
@@ -53,89 +108,153 @@ class MultiCountyAggregator:
             print(f"Warning: Race mappings file not found: {self.races_file}")
             return {}
         
+        # Reuse previously parsed mappings while the workbook is unchanged
+        cached = self._load_cached_race_mappings()
+        if cached is not None:
+            return cached
+        
         try:
-            wb = openpyxl.load_workbook(self.races_file, data_only=True)
-            ws = wb.active
-            
-            mappings = {
-                'congress': {},
-                'state_senate': {},
-                'state_house': {},
-                'judicial': {}
-            }
-            
-            # Read data (skip header row)
-            for row in ws.iter_rows(min_row=2, values_only=True):
-                if not row[0]:  # Skip empty rows
-                    continue
-                
-                county = str(row[0]).strip()
-                
-                # Congress districts (column 2)
-                if row[1]:
-                    districts = self._parse_districts(str(row[1]))
-                    for district in districts:
-                        if district not in mappings['congress']:
-                            mappings['congress'][district] = []
-                        mappings['congress'][district].append(county)
-                
-                # State Senate (column 3)
-                if row[2]:
-                    districts = self._parse_districts(str(row[2]))
-                    for district in districts:
-                        if district not in mappings['state_senate']:
-                            mappings['state_senate'][district] = []
-                        mappings['state_senate'][district].append(county)
-                
-                # State House (column 4)
-                if row[3]:
-                    districts = self._parse_districts(str(row[3]))
-                    for district in districts:
-                        if district not in mappings['state_house']:
-                            mappings['state_house'][district] = []
-                        mappings['state_house'][district].append(county)
-            
+            # Imported here so runs without a workbook skip the openpyxl import cost
+            import openpyxl
+
+            # Read-only mode streams rows instead of building the full cell model
+            wb = openpyxl.load_workbook(self.races_file, read_only=True, data_only=True)
+            try:
+                ws = wb.active
+
+                mappings = {
+                    'congress': {},
+                    'state_senate': {},
+                    'state_house': {},
+                    'judicial': {}
+                }
+
+                # Read data (skip header row)
+                for row in ws.iter_rows(min_row=2, values_only=True):
+                    if not row or not row[0]:  # Skip empty rows
+                        continue
+
+                    county = str(row[0]).strip()
+
+                    # Congress districts (column 2)
+                    if len(row) > 1 and row[1]:
+                        districts = self._parse_districts(str(row[1]))
+                        for district in districts:
+                            if district not in mappings['congress']:
+                                mappings['congress'][district] = []
+                            mappings['congress'][district].append(county)
+
+                    # State Senate (column 3)
+                    if len(row) > 2 and row[2]:
+                        districts = self._parse_districts(str(row[2]))
+                        for district in districts:
+                            if district not in mappings['state_senate']:
+                                mappings['state_senate'][district] = []
+                            mappings['state_senate'][district].append(county)
+
+                    # State House (column 4)
+                    if len(row) > 3 and row[3]:
+                        districts = self._parse_districts(str(row[3]))
+                        for district in districts:
+                            if district not in mappings['state_house']:
+                                mappings['state_house'][district] = []
+                            mappings['state_house'][district].append(county)
+            finally:
+                # Read-only workbooks keep the file handle open until closed
+                wb.close()
+
+            self._save_cached_race_mappings(mappings)
             return mappings
             
         except Exception as e:
             print(f"Warning: Could not load race mappings: {e}")
             return {}
     
+    def _race_mappings_cache_path(self) -> Path:
+        """Cache file for the races workbook, named by a hash of its path.
+        
+        Kept out of the workbook's directory so it can never be picked up
+        as a county result file.
+        """
+        races_path = str(Path(self.races_file).resolve())
+        digest = hashlib.blake2b(races_path.encode(), digest_size=8).hexdigest()
+        return self.cache_dir / f"{Path(self.races_file).stem}-{digest}.mappings.json"
+    
+    def _load_cached_race_mappings(self) -> Optional[Dict]:
+        """Return cached race mappings if the cache is newer than the workbook."""
+        cache_path = self._race_mappings_cache_path()
+        try:
+            if cache_path.stat().st_mtime < os.path.getmtime(self.races_file):
+                return None
+            with open(cache_path, 'r') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if not isinstance(cached, dict) or cached.get('version') != _MAPPINGS_CACHE_VERSION:
+            return None
+        
+        # JSON object keys are strings; district numbers are ints. A cache
+        # with any other shape is ignored and the workbook parsed again.
+        try:
+            mappings = {
+                race_type: {int(district): counties for district, counties in districts.items()}
+                for race_type, districts in cached['mappings'].items()
+            }
+        except (KeyError, AttributeError, TypeError, ValueError):
+            return None
+        for districts in mappings.values():
+            for counties in districts.values():
+                if not isinstance(counties, list):
+                    return None
+        return mappings
+    
+    def _save_cached_race_mappings(self, mappings: Dict) -> None:
+        """Best-effort write of parsed race mappings to the cache directory."""
+        cache_path = self._race_mappings_cache_path()
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, 'w') as f:
+                json.dump({'version': _MAPPINGS_CACHE_VERSION, 'mappings': mappings}, f)
+        except OSError:
+            pass  # Unwritable location - parse the workbook again next time
+    
     def _parse_districts(self, district_str: str) -> List[int]:
         """Parse district numbers from various formats."""
-        districts = []
+        districts = set()
         
-        # Remove spaces and convert to string
-        district_str = str(district_str).replace(' ', '')
+        # Remove whitespace (callers already pass a string)
+        district_str = district_str.translate(_NO_WS)
         
         # Handle comma-separated values
-        parts = district_str.split(',')
-        
-        for part in parts:
+        for part in district_str.split(','):
+            # Plain integers are the common case
+            if part.isdigit():
+                districts.add(int(part))
             # Handle ranges (e.g., "1-20")
-            if '-' in part:
+            elif '-' in part:
                 try:
                     start, end = part.split('-')
-                    start_num = int(float(start))
-                    end_num = int(float(end))
-                    districts.extend(range(start_num, end_num + 1))
+                    districts.update(range(int(float(start)), int(float(end)) + 1))
                 except:
                     pass
             else:
-                # Single number
+                # Handle floats like "15.0"
                 try:
-                    # Handle floats like "15.0"
-                    num = int(float(part))
-                    districts.append(num)
+                    districts.add(int(float(part)))
                 except:
                     pass
         
-        return sorted(set(districts))
+        return sorted(districts)
     
-    def aggregate(self) -> Dict:
+    def aggregate(self, output_file: str = 'statewide_results.json') -> Dict:
         """
         Aggregate results from all county files.
         
+        Args:
+            output_file: Where the statewide JSON will be saved; county file
+                         references are written relative to its directory
+        
         Returns:
             Dictionary containing aggregated statewide results
         """
@@ -158,19 +277,20 @@ class MultiCountyAggregator:
         
         # Aggregate by race type
         print("Aggregating results...")
+        race_index = self._index_all_races(county_results)
         aggregated = {
             "aggregated_at": datetime.now().isoformat(),
             "num_counties": len(county_results),
             "counties_included": list(county_results.keys()),
             "statewide_races": self._aggregate_statewide_races(county_results),
             "multi_county_races": {
-                "congress": self._aggregate_congress(county_results),
-                "state_senate": self._aggregate_state_senate(county_results),
-                "state_house": self._aggregate_state_house(county_results),
+                "congress": self._aggregate_congress(race_index),
+                "state_senate": self._aggregate_state_senate(race_index),
+                "state_house": self._aggregate_state_house(race_index),
                 "regional_superintendents": self._aggregate_superintendents(county_results),
                 "cross_county_referendums": self._aggregate_cross_county_referendums(county_results),
             },
-            "county_results": county_results
+            "county_results": county_results if self.embed_counties else self._county_references(county_results, output_file)
         }
         
         print("✓ Aggregation complete!")
@@ -189,152 +309,169 @@ class MultiCountyAggregator:
         
         print(f"Scanning: {self.results_dir}")
         
-        for file_path in self.results_dir.glob("*.json"):
-            try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                
-                # Extract county name
-                county_name = data.get('county', file_path.stem)
-                
-                # Skip error files
-                if 'error' in data:
-                    print(f"  ⚠ Skipping {county_name}: {data['error']}")
-                    continue
-                
-                county_results[county_name] = data
-                print(f"  ✓ {county_name}: {len(data.get('contests', []))} contests")
-                
-            except Exception as e:
-                print(f"  ✗ Error loading {file_path.name}: {e}")
+        # scandir yields DirEntry objects with cached file-type info
+        with os.scandir(self.results_dir) as it:
+            file_entries = [e for e in it if e.name.endswith('.json') and e.is_file()]
+        if not file_entries:
+            return {}
+        
+        # Overlap disk reads across files; map() keeps the original file order
+        with ThreadPoolExecutor(max_workers=min(16, len(file_entries))) as executor:
+            loaded = list(executor.map(self._load_county_file, file_entries))
+        
+        for file_entry, data, error in loaded:
+            if error is not None:
+                print(f"  ✗ Error loading {file_entry.name}: {error}")
+                continue
+            
+            # Extract county name
+            county_name = data.get('county', os.path.splitext(file_entry.name)[0])
+            
+            # Skip error files
+            if 'error' in data:
+                print(f"  ⚠ Skipping {county_name}: {data['error']}")
+                continue
+            
+            county_results[county_name] = data
+            self.county_files[county_name] = file_entry.path
+            print(f"  ✓ {county_name}: {len(data.get('contests', []))} contests")
         
         return county_results
     
+    def _county_references(self, county_results: Dict, output_file: str) -> Dict:
+        """
+        Describe each county by its source file instead of embedding its data.
+        
+        The raw county JSON files are published alongside the statewide output,
+        so widgets can fetch them directly when they need full county detail.
+        Paths are relative to the statewide JSON, the way consumers resolve them.
+        """
+        output_dir = Path(output_file).parent
+        return {
+            county_name: {
+                "file": Path(os.path.relpath(self.county_files[county_name], start=output_dir)).as_posix(),
+                "num_contests": len(self._flatten_contests(data)),
+            }
+            for county_name, data in county_results.items()
+        }
+    
+    def _load_county_file(self, file_entry: os.DirEntry) -> Tuple[os.DirEntry, Dict, Exception]:
+        """Read one county JSON file, returning (entry, data, error)."""
+        try:
+            if orjson is not None:
+                with open(file_entry, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(file_entry, 'r') as f:
+                    data = json.load(f)
+        except Exception as e:
+            return file_entry, None, e
+        
+        # County results are always a JSON object; anything else isn't ours
+        if not isinstance(data, dict):
+            return file_entry, None, ValueError(f"expected a JSON object, got {type(data).__name__}")
+        return file_entry, data, None
+    
     def _aggregate_statewide_races(self, county_results: Dict) -> Dict:
         """Aggregate races that appear in all/most counties (e.g., President)."""
         statewide = {}
+        normalize = self._normalize_contest_name
         
-        # Collect all contests that appear in multiple counties
+        # First pass: count appearances per normalized contest name
+        counts = Counter(
+            normalize(contest['name'])
+            for data in county_results.values()
+            for contest in data.get('contests', [])
+        )
+        
+        # Second pass: collect appearances only for contests in enough counties
+        # (normalization is cached, so repeat names are lookups)
         contest_appearances = defaultdict(list)
         
         for county_name, data in county_results.items():
             for contest in data.get('contests', []):
-                contest_key = self._normalize_contest_name(contest['name'])
-                contest_appearances[contest_key].append({
-                    'county': county_name,
-                    'contest': contest
-                })
+                contest_key = normalize(contest['name'])
+                if counts[contest_key] >= MIN_STATEWIDE_COUNTIES:
+                    contest_appearances[contest_key].append({
+                        'county': county_name,
+                        'contest': contest
+                    })
         
-        # Aggregate contests that appear in multiple counties
         for contest_key, appearances in contest_appearances.items():
-            if len(appearances) >= 5:  # At least 5 counties = likely statewide
-                aggregated_contest = self._merge_contests(appearances)
-                statewide[contest_key] = aggregated_contest
+            statewide[contest_key] = self._merge_contests(appearances)
         
         return statewide
     
-    def _aggregate_congress(self, county_results: Dict) -> Dict:
-        """Aggregate Congressional district races."""
-        congress = {}
-        
-        if not self.race_mappings.get('congress'):
-            return {}
+    def _index_all_races(self, county_results: Dict) -> Dict[Tuple[str, int], Dict[str, List[Dict]]]:
+        """
+        Index every county contest by (race_type, district) in a single pass.
+
+        Each contest is classified once by _classify_race, so the per-district
+        aggregation below only has to look up its bucket instead of rescanning
+        every county.
+
+        Returns:
+            Dict mapping (race_type, district) to {county: [contests]}
+        """
+        index = defaultdict(lambda: defaultdict(list))
         
-        for district, counties in self.race_mappings['congress'].items():
-            district_key = f"District {district}"
-            contest_data = self._aggregate_multi_county_race(
-                county_results,
-                counties,
-                race_patterns=[
-                    f"CONGRESS.*{district}",
-                    f"CONGRESSIONAL DISTRICT {district}",
-                    f"U.S. REPRESENTATIVE.*{district}"
-                ]
-            )
-            
-            if contest_data:
-                congress[district_key] = contest_data
+        for county, data in county_results.items():
+            for contest in data.get('contests', []):
+                race = self._classify_race(contest['name'])
+                if race:
+                    index[race][county].append(contest)
         
-        return congress
+        return index
     
-    def _aggregate_state_senate(self, county_results: Dict) -> Dict:
-        """Aggregate State Senate district races."""
-        senate = {}
-        
-        if not self.race_mappings.get('state_senate'):
-            return {}
+    def _classify_race(self, contest_name: str) -> Optional[Tuple[str, int]]:
+        """Return (race_type, district) for a multi-county race contest, else None."""
+        upper_name = contest_name.upper()
         
-        for district, counties in self.race_mappings['state_senate'].items():
-            district_key = f"District {district}"
-            contest_data = self._aggregate_multi_county_race(
-                county_results,
-                counties,
-                race_patterns=[
-                    f"STATE SENATE.*{district}",
-                    f"SENATOR.*{district}",
-                    f"SENATE DISTRICT {district}"
-                ]
-            )
-            
-            if contest_data:
-                senate[district_key] = contest_data
+        for race_type, keywords in RACE_KEYWORDS.items():
+            for keyword in keywords:
+                pos = upper_name.find(keyword)
+                if pos < 0:
+                    continue
+                district = _DIGITS_RE.search(upper_name, pos + len(keyword))
+                if district:
+                    return race_type, int(district.group())
         
-        return senate
+        return None
     
-    def _aggregate_state_house(self, county_results: Dict) -> Dict:
+    def _aggregate_congress(self, race_index: Dict) -> Dict:
+        """Aggregate Congressional district races."""
+        return self._aggregate_district_races(race_index, 'congress')
+    
+    def _aggregate_state_senate(self, race_index: Dict) -> Dict:
+        """Aggregate State Senate district races."""
+        return self._aggregate_district_races(race_index, 'state_senate')
+    
+    def _aggregate_state_house(self, race_index: Dict) -> Dict:
         """Aggregate State House district races."""
-        house = {}
+        return self._aggregate_district_races(race_index, 'state_house')
+    
+    def _aggregate_district_races(self, race_index: Dict, race_type: str) -> Dict:
+        """Aggregate every district of one race type across its mapped counties."""
+        races = {}
         
-        if not self.race_mappings.get('state_house'):
+        if not self.race_mappings.get(race_type):
             return {}
         
-        for district, counties in self.race_mappings['state_house'].items():
-            district_key = f"District {district}"
-            contest_data = self._aggregate_multi_county_race(
-                county_results,
-                counties,
-                race_patterns=[
-                    f"STATE REPRESENTATIVE.*{district}",
-                    f"REPRESENTATIVE.*{district}",
-                    f"HOUSE DISTRICT {district}",
-                    f"STATE HOUSE.*{district}"
-                ]
-            )
-            
-            if contest_data:
-                house[district_key] = contest_data
-        
-        return house
-    
-    def _aggregate_multi_county_race(
-        self,
-        county_results: Dict,
-        counties: List[str],
-        race_patterns: List[str]
-    ) -> Dict:
-        """Aggregate a race across multiple counties."""
-        appearances = []
-        
-        for county in counties:
-            if county not in county_results:
+        for district, counties in self.race_mappings[race_type].items():
+            by_county = race_index.get((race_type, district))
+            if not by_county:
                 continue
             
-            for contest in county_results[county].get('contests', []):
-                contest_name = contest['name'].upper()
-                
-                # Check if this contest matches any pattern
-                for pattern in race_patterns:
-                    if re.search(pattern, contest_name, re.IGNORECASE):
-                        appearances.append({
-                            'county': county,
-                            'contest': contest
-                        })
-                        break
-        
-        if not appearances:
-            return None
+            appearances = [
+                {'county': county, 'contest': contest}
+                for county in counties
+                for contest in by_county.get(county, [])
+            ]
+            
+            if appearances:
+                races[f"District {district}"] = self._merge_contests(appearances)
         
-        return self._merge_contests(appearances)
+        return races
     
     def _merge_contests(self, appearances: List[Dict]) -> Dict:
         """Merge multiple instances of the same contest."""
@@ -344,62 +481,66 @@ class MultiCountyAggregator:
             "party": appearances[0]['contest'].get('party', 'Non-Partisan'),
             "counties": [a['county'] for a in appearances],
             "num_counties": len(appearances),
-            "candidates": {}
         }
         
         # Aggregate candidate votes
+        candidates = defaultdict(lambda: {"name": None, "votes": 0, "counties": []})
+        total_votes = 0
         for appearance in appearances:
+            county = appearance['county']
             for candidate in appearance['contest'].get('candidates', []):
-                name = self._normalize_candidate_name(candidate['name'])
+                entry = candidates[self._normalize_candidate_name(candidate['name'])]
+                if entry['name'] is None:
+                    entry['name'] = candidate['name']
                 
-                if name not in merged['candidates']:
-                    merged['candidates'][name] = {
-                        "name": candidate['name'],
-                        "votes": 0,
-                        "counties": []
-                    }
-                
-                merged['candidates'][name]['votes'] += candidate.get('votes', 0)
-                merged['candidates'][name]['counties'].append(appearance['county'])
+                votes = candidate.get('votes', 0) or 0
+                entry['votes'] += votes
+                entry['counties'].append(county)
+                total_votes += votes
+        merged['candidates'] = candidates
         
         # Calculate percentages
-        total_votes = sum(c['votes'] for c in merged['candidates'].values())
         if total_votes > 0:
             for candidate in merged['candidates'].values():
                 candidate['percent'] = round((candidate['votes'] / total_votes) * 100, 2)
         
-        # Convert to list and sort by votes
-        merged['candidates'] = sorted(
-            merged['candidates'].values(),
-            key=lambda x: x['votes'],
-            reverse=True
-        )
+        # Convert to list and sort by votes (only the leaders when TOP_K is set)
+        if TOP_K is None:
+            merged['candidates'] = sorted(
+                merged['candidates'].values(),
+                key=lambda x: x['votes'],
+                reverse=True
+            )
+        else:
+            merged['candidates'] = heapq.nlargest(
+                TOP_K,
+                merged['candidates'].values(),
+                key=lambda x: x['votes']
+            )
         
         merged['total_votes'] = total_votes
         
         return merged
     
-    def _normalize_contest_name(self, name: str) -> str:
-        """Normalize contest name for matching."""
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def _normalize_contest_name(name: str) -> str:
+        """Normalize contest name for matching (cached: names repeat across counties)."""
         # Remove extra whitespace and standardize
-        normalized = ' '.join(name.upper().split())
-        
-        # Remove common variations
-        normalized = normalized.replace('PRESIDENT OF THE UNITED STATES', 'PRESIDENT')
-        normalized = normalized.replace('U.S. SENATOR', 'SENATOR')
-        normalized = normalized.replace('U.S. REPRESENTATIVE', 'REPRESENTATIVE')
+        normalized = _WS_RE.sub(' ', name).strip().upper()
         
-        return normalized
+        # Remove common variations in a single pass
+        return _CONTEST_ALIAS_RE.sub(lambda m: CONTEST_ALIASES[m.group(0)], normalized)
     
-    def _normalize_candidate_name(self, name: str) -> str:
-        """Normalize candidate name for matching."""
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def _normalize_candidate_name(name: str) -> str:
+        """Normalize candidate name for matching (cached: names repeat across counties)."""
         # Remove party indicators
-        name = re.sub(r'\s*\([A-Z]+\)\s*', '', name)
+        name = _PARTY_SUFFIX_RE.sub('', name)
         
         # Remove extra whitespace
-        name = ' '.join(name.upper().split())
-        
-        return name
+        return _WS_RE.sub(' ', name).strip().upper()
 
     def _aggregate_superintendents(self, county_results: Dict) -> Dict:
         """
@@ -674,6 +815,47 @@ class MultiCountyAggregator:
         return []
 
 
+def _encode_json(value) -> bytes:
+    """Encode one JSON value compactly, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, separators=(',', ':')).encode('utf-8')
+
+
+def _write_json_streamed(f, value, depth: int) -> None:
+    """
+    Write a JSON value, streaming dicts key-by-key down to the given depth.
+    
+    Values below that depth are encoded one at a time with _encode_json, so
+    only one county's data (or one district's race) is ever held as bytes.
+    """
+    if depth <= 0 or not isinstance(value, dict):
+        f.write(_encode_json(value))
+        return
+    
+    f.write(b'{')
+    for i, (key, item) in enumerate(value.items()):
+        if i:
+            f.write(b',')
+        f.write(_encode_json(str(key)))
+        f.write(b':')
+        _write_json_streamed(f, item, depth - 1)
+    f.write(b'}')
+
+
+def save_results(results: Dict, output_file: str) -> None:
+    """
+    Stream aggregated results to disk one section at a time.
+    
+    Sections, race types and counties are written key-by-key, so peak memory
+    is bounded by the largest single race or county rather than by a full
+    encoded copy of the whole tree.
+    """
+    with open(output_file, 'wb') as f:
+        # results → section → race type / county → district / county field
+        _write_json_streamed(f, results, depth=3)
+
+
 def git_push(output_file: str, results_dir: str, repo_dir: str = None) -> bool:
     """
     Auto-commit and push results to GitHub so widgets update automatically.
@@ -691,46 +873,38 @@ def git_push(output_file: str, results_dir: str, repo_dir: str = None) -> bool:
     print("PUSHING TO GITHUB")
     print("=" * 80)
 
-    # Auto-detect repo root if not specified
-    if repo_dir is None:
-        try:
-            result = subprocess.run(
-                ["git", "rev-parse", "--show-toplevel"],
-                capture_output=True, text=True, check=True
-            )
-            repo_dir = result.stdout.strip()
-        except subprocess.CalledProcessError:
-            print("❌ Not inside a git repository. Run 'git init' first.")
-            print("   See GITHUB_SETUP.md for instructions.")
-            return False
-
+    # Git resolves the repo root itself, so commands run from the current
+    # directory when repo_dir isn't specified (no separate rev-parse spawn)
     def run(cmd, cwd=repo_dir):
         """Run a shell command and return (success, output)."""
         result = subprocess.run(cmd, capture_output=True, text=True, cwd=cwd)
         return result.returncode == 0, result.stdout.strip(), result.stderr.strip()
 
-    # Check if there's anything to commit
-    ok, stdout, _ = run(["git", "status", "--porcelain"])
-    if not stdout:
-        print("✓ No changes to push (results unchanged since last push)")
-        return True
+    # Stage the output file and county results directory in one invocation
+    base_dir = repo_dir or "."
+    files_to_add = [f for f in (output_file, results_dir)
+                    if os.path.exists(os.path.join(base_dir, f))]
+    for f in (output_file, results_dir):
+        if f not in files_to_add:
+            print(f"⚠ Could not stage {f}: path not found")
 
-    # Stage the output file and county results directory
-    files_to_add = [output_file, results_dir]
-    for f in files_to_add:
-        ok, _, err = run(["git", "add", f])
-        if not ok:
-            print(f"⚠ Could not stage {f}: {err}")
+    ok, _, err = run(["git", "add", "--"] + files_to_add)
+    if not ok:
+        if "not a git repository" in err:
+            print("❌ Not inside a git repository. Run 'git init' first.")
+            print("   See GITHUB_SETUP.md for instructions.")
+            return False
+        print(f"⚠ Could not stage {', '.join(files_to_add)}: {err}")
 
-    # Commit with a timestamp
+    # Commit with a timestamp; git reports an unchanged tree as "nothing to commit"
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     commit_msg = f"Results update: {timestamp}"
-    ok, _, err = run(["git", "commit", "-m", commit_msg])
+    ok, out, err = run(["git", "commit", "-m", commit_msg])
     if not ok:
-        if "nothing to commit" in err:
+        if "nothing to commit" in out or "nothing to commit" in err:
             print("✓ No changes to push (results unchanged since last push)")
             return True
-        print(f"❌ Git commit failed: {err}")
+        print(f"❌ Git commit failed: {err or out}")
         return False
 
     # Push to GitHub
@@ -796,6 +970,19 @@ Examples:
         help='Auto-commit and push results to GitHub after aggregation'
     )
 
+    parser.add_argument(
+        '--embed-counties',
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help='Embed full raw county data in the output (default: reference county files)'
+    )
+
+    parser.add_argument(
+        '--cache-dir',
+        default=None,
+        help='Directory for parsed race mappings (default: .cache/aggregate next to this script)'
+    )
+
     parser.add_argument(
         '--repo-dir',
         default=None,
@@ -807,15 +994,16 @@ Examples:
     # Create aggregator
     aggregator = MultiCountyAggregator(
         results_dir=args.results_dir,
-        races_file=args.races
+        races_file=args.races,
+        embed_counties=args.embed_counties,
+        cache_dir=args.cache_dir
     )
 
     # Aggregate results
-    results = aggregator.aggregate()
+    results = aggregator.aggregate(output_file=args.output)
 
     # Save results
-    with open(args.output, 'w') as f:
-        json.dump(results, f, indent=2)
+    save_results(results, args.output)
 
     print("=" * 80)
     print("RESULTS SUMMARY")
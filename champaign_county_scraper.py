@@ -15,17 +15,61 @@ which contains county-wide totals for all contests.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import functools
 import json
+import logging
+import os
 import re
+import tempfile
 from datetime import datetime
 from typing import Dict, List, Optional
 
+logger = logging.getLogger(__name__)
+
 try:
-    import openpyxl
-    EXCEL_AVAILABLE = True
+    import orjson  # Optional: much faster JSON encoding
 except ImportError:
-    EXCEL_AVAILABLE = False
-    print("Warning: openpyxl not installed. Install with: pip install openpyxl")
+    orjson = None
+
+# Party detection tables, checked in order and first match wins: explicit
+# markers beat party words, and Democratic is tested before Republican
+_CONTEST_PARTY_CHECKS = (
+    ((' (dem)', '(democratic'), 'Democratic'),
+    ((' (rep)', '(republican'), 'Republican'),
+    (('democratic',), 'Democratic'),
+    (('republican',), 'Republican'),
+)
+_SHEET_PARTY_CHECKS = (
+    ('dem', 'Democratic'),
+    ('rep', 'Republican'),
+    ('non', 'Non-Partisan'),
+)
+_BALLOT_SHEET_RE = re.compile(r'dem|rep|non|ballot|summary|result', re.IGNORECASE)
+# Thousands separators and percent signs dropped from vote cells in one pass
+# (int() already ignores surrounding whitespace)
+_VOTE_TRANS = str.maketrans('', '', ',%')
+
+def _load_openpyxl():
+    """Import openpyxl on first use so --help and the instructions path skip it"""
+    try:
+        import openpyxl
+        return openpyxl
+    except ImportError:
+        return None
+
+@functools.lru_cache(maxsize=512)
+def _detect_party(contest_name: str) -> str:
+    """Cached party detection; contest names repeat across ballot sheets"""
+    contest_lower = contest_name.lower()
+    for markers, party in _CONTEST_PARTY_CHECKS:
+        for marker in markers:
+            if marker in contest_lower:
+                return party
+    
+    # Default to Non-Partisan for local races
+    return 'Non-Partisan'
 
 class ChampaignCountyScraper:
     """Scraper for Champaign County Clerk election results"""
@@ -51,6 +95,18 @@ class ChampaignCountyScraper:
             'CountySummary.xlsx',
             'summary.xlsx'
         ]
+        
+        # Reuse pooled connections (with retries) across document downloads
+        self.session = requests.Session()
+        self.session.headers.update({
+            'Accept-Encoding': 'gzip, deflate'
+        })
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self.session.mount('https://', adapter)
     
     def detect_party(self, contest_name: str) -> str:
         """Detect party from contest name
@@ -63,22 +119,7 @@ class ChampaignCountyScraper:
         Returns:
             Party string
         """
-        contest_lower = contest_name.lower()
-        
-        # Check for explicit party markers
-        if ' (dem)' in contest_lower or '(democratic' in contest_lower:
-            return 'Democratic'
-        elif ' (rep)' in contest_lower or '(republican' in contest_lower:
-            return 'Republican'
-        elif 'democratic' in contest_lower:
-            return 'Democratic'
-        elif 'republican' in contest_lower:
-            return 'Republican'
-        elif 'nonpartisan' in contest_lower or 'non-partisan' in contest_lower:
-            return 'Non-Partisan'
-        
-        # Default to Non-Partisan for local races
-        return 'Non-Partisan'
+        return _detect_party(contest_name)
     
     def scrape_from_excel_url(self, excel_url: str) -> Dict:
         """Scrape results from County Summary Excel file
@@ -89,7 +130,9 @@ class ChampaignCountyScraper:
         Returns:
             Dictionary with scraped results
         """
-        if not EXCEL_AVAILABLE:
+        openpyxl = _load_openpyxl()
+        if openpyxl is None:
+            logger.warning("openpyxl not installed. Install with: pip install openpyxl")
             return {
                 'error': 'openpyxl not installed',
                 'message': 'Install with: pip install openpyxl',
@@ -97,20 +140,35 @@ class ChampaignCountyScraper:
                 'scraped_at': datetime.now().isoformat()
             }
         
-        print(f"Scraping {self.authority}...")
-        print(f"Excel URL: {excel_url}")
+        logger.info("Scraping %s...", self.authority)
+        logger.info("Excel URL: %s", excel_url)
         
         try:
-            # Download Excel file
-            response = requests.get(excel_url, timeout=60)
-            response.raise_for_status()
-            
-            # Save to temporary file and parse
-            import io
-            excel_file = io.BytesIO(response.content)
-            
-            workbook = openpyxl.load_workbook(excel_file, data_only=True)
-            results = self._parse_county_summary(workbook)
+            # Stream the Excel file to disk instead of buffering it in memory;
+            # the temp file is removed however the download or parse ends
+            with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as tf:
+                excel_path = tf.name
+            try:
+                with self.session.get(excel_url, timeout=60, stream=True) as response:
+                    response.raise_for_status()
+                    with open(excel_path, 'wb') as f:
+                        for chunk in response.iter_content(chunk_size=65536):
+                            f.write(chunk)
+                
+                # Read-only mode streams rows without building styled Cell objects
+                workbook = openpyxl.load_workbook(
+                    excel_path,
+                    read_only=True,
+                    data_only=True,
+                    keep_vba=False,
+                    keep_links=False
+                )
+                try:
+                    results = self._parse_county_summary(workbook)
+                finally:
+                    workbook.close()
+            finally:
+                os.unlink(excel_path)
             
             results['authority'] = self.authority
             results['jurisdiction'] = self.county_name
@@ -119,11 +177,11 @@ class ChampaignCountyScraper:
             results['source'] = 'County Summary Excel'
             results['excel_url'] = excel_url
             
-            print(f"✓ Successfully scraped {len(results.get('contests', []))} contests")
+            logger.info("✓ Successfully scraped %d contests", len(results.get('contests', [])))
             return results
             
         except requests.RequestException as e:
-            print(f"✗ Error fetching Excel: {e}")
+            logger.error("✗ Error fetching Excel: %s", e)
             return {
                 'error': str(e),
                 'authority': self.authority,
@@ -158,7 +216,7 @@ class ChampaignCountyScraper:
             'scraped_at': datetime.now().isoformat()
         }
     
-    def _parse_county_summary(self, workbook: openpyxl.Workbook) -> Dict:
+    def _parse_county_summary(self, workbook: 'openpyxl.Workbook') -> Dict:
         """Parse County Summary Excel file
         
         Format varies but typically has sheets for each party/ballot type.
@@ -175,9 +233,19 @@ class ChampaignCountyScraper:
             'summary': {}
         }
         
+        # Only parse ballot/result sheets; cover and index sheets hold no
+        # contests. Fall back to every sheet if none look like results.
+        sheet_names = [n for n in workbook.sheetnames if _BALLOT_SHEET_RE.search(n)]
+        if sheet_names:
+            for skipped in workbook.sheetnames:
+                if skipped not in sheet_names:
+                    logger.debug("  Skipping sheet: %s", skipped)
+        else:
+            sheet_names = workbook.sheetnames
+        
         # Process each sheet (typically DEM, REP, NON ballots)
-        for sheet_name in workbook.sheetnames:
-            print(f"  Processing sheet: {sheet_name}")
+        for sheet_name in sheet_names:
+            logger.debug("  Processing sheet: %s", sheet_name)
             
             sheet = workbook[sheet_name]
             party = self._detect_party_from_sheet(sheet_name)
@@ -197,15 +265,10 @@ class ChampaignCountyScraper:
             Party string
         """
         name_lower = sheet_name.lower()
-        
-        if 'dem' in name_lower or 'democratic' in name_lower:
-            return 'Democratic'
-        elif 'rep' in name_lower or 'republican' in name_lower:
-            return 'Republican'
-        elif 'non' in name_lower or 'nonpartisan' in name_lower:
-            return 'Non-Partisan'
-        else:
-            return 'Unknown'
+        for marker, party in _SHEET_PARTY_CHECKS:
+            if marker in name_lower:
+                return party
+        return 'Unknown'
     
     def _parse_sheet_contests(self, sheet, default_party: str) -> List[Dict]:
         """Parse contests from an Excel sheet
@@ -223,67 +286,109 @@ class ChampaignCountyScraper:
         contests = []
         current_contest = None
         
+        # Local bindings for the per-row hot path
+        append_contest = contests.append
+        detect = self.detect_party
+        add_candidate = None
+        
         for row in sheet.iter_rows(values_only=True):
-            if not row or not any(row):
+            if not row:
+                continue
+            
+            # Contest headers and candidate rows always populate the first
+            # column, so rows without it (including empty trailer rows) are
+            # skipped without scanning the other cells
+            first = row[0]
+            if first is None or first == '':
                 continue
             
-            # Convert row to list, handling None values
-            row = [str(cell) if cell is not None else '' for cell in row]
+            # Only the first cell is needed as text; other cells keep the
+            # types openpyxl already parsed
+            if not isinstance(first, str):
+                first = str(first)
             
             # Check if this is a contest header (typically bold, left-aligned)
             # Usually first column has contest name
-            if row[0] and not row[0].isdigit():
+            if not first.isdigit():
                 # Might be a contest header
                 # Check if following rows have candidate names and numbers
                 
                 # Save previous contest if exists
-                if current_contest and current_contest.get('candidates'):
-                    contests.append(current_contest)
+                if current_contest and current_contest['candidates']:
+                    append_contest(current_contest)
                 
                 # Start new contest
-                contest_name = row[0].strip()
-                if contest_name and len(contest_name) > 3:
+                contest_name = first.strip()
+                if len(contest_name) > 3:
                     current_contest = {
                         'name': contest_name,
-                        'party': self.detect_party(contest_name) or default_party,
+                        'party': detect(contest_name) or default_party,
                         'candidates': []
                     }
+                    add_candidate = current_contest['candidates'].append
             
             # Check if this is a candidate row
             # Format: [Candidate Name] [Votes] [Percent]
             elif current_contest and len(row) >= 2:
-                candidate_name = row[0].strip() if row[0] else ''
+                candidate_name = first.strip()
                 
                 # Try to find vote column (usually second or third column)
                 votes = None
                 for cell in row[1:4]:
-                    try:
-                        votes = int(str(cell).replace(',', '').replace('%', '').strip())
-                        if votes > 0:
-                            break
-                    except (ValueError, AttributeError):
+                    cell_type = type(cell)
+                    if cell_type is int:
+                        votes = cell
+                    elif cell_type is float:
+                        # Whole numbers like 300.0 are counts; 45.6 is a percent
+                        if not cell.is_integer():
+                            continue
+                        votes = int(cell)
+                    elif cell_type is str:
+                        try:
+                            votes = int(cell.translate(_VOTE_TRANS))
+                        except ValueError:
+                            continue
+                    else:
                         continue
+                    if votes > 0:
+                        break
                 
+                # Candidates are held as (name, votes) tuples while parsing;
+                # output dicts are built once the contest total is known
                 if candidate_name and votes is not None:
-                    current_contest['candidates'].append({
-                        'name': candidate_name,
-                        'votes': votes,
-                        'percent': 0  # Will calculate after
-                    })
+                    add_candidate((candidate_name, votes))
         
         # Add last contest
-        if current_contest and current_contest.get('candidates'):
-            contests.append(current_contest)
+        if current_contest and current_contest['candidates']:
+            append_contest(current_contest)
         
-        # Calculate percentages
+        # A short header row saves the open contest without replacing it, so
+        # the same contest can be listed twice; finish each one only once
+        finished = set()
         for contest in contests:
-            total_votes = sum(c['votes'] for c in contest['candidates'])
-            if total_votes > 0:
-                for candidate in contest['candidates']:
-                    candidate['percent'] = round(candidate['votes'] / total_votes * 100, 2)
+            if id(contest) not in finished:
+                finished.add(id(contest))
+                self._finish_contest(contest)
         
         return contests
     
+    def _finish_contest(self, contest: Dict) -> Dict:
+        """Build candidate dicts with percentages for a completed contest
+        
+        Args:
+            contest: Contest whose candidates are (name, votes) tuples
+            
+        Returns:
+            The same contest with candidate dictionaries
+        """
+        total_votes = sum(votes for _, votes in contest['candidates'])
+        contest['candidates'] = [
+            {'name': name, 'votes': votes,
+             'percent': round(votes / total_votes * 100, 2) if total_votes > 0 else 0}
+            for name, votes in contest['candidates']
+        ]
+        return contest
+    
     def save_results(self, results: Dict, output_dir: str = '.'):
         """Save results to JSON file
         
@@ -293,10 +398,15 @@ class ChampaignCountyScraper:
         """
         filename = f"{output_dir}/champaign_county_results.json"
         
-        with open(filename, 'w') as f:
-            json.dump(results, f, indent=2)
+        # Compact output: these files are read by the aggregator, not people
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_NAIVE_UTC))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(results, f, separators=(',', ':'))
         
-        print(f"✓ Saved results to {filename}")
+        logger.info("✓ Saved results to %s", filename)
 
 def print_instructions():
     """Print detailed usage instructions"""
@@ -352,8 +462,14 @@ def main():
     parser.add_argument('--output', default='.',
                        help='Output directory for JSON results')
     
+    parser.add_argument('--verbose', '-v', action='store_true',
+                       help='Show per-sheet progress messages')
+    
     args = parser.parse_args()
     
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO,
+                        format='%(message)s')
+    
     scraper = ChampaignCountyScraper(args.date)
     
     if args.summary_url:
@@ -18,17 +18,246 @@ import requests
 import json
 import re
 from datetime import datetime
-from typing import Dict, List, Optional
-import io
+from typing import BinaryIO, Dict, List, Optional, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import tempfile
+
+# PDFs smaller than this stay in memory; larger ones spill to a temp file
+PDF_SPOOL_MAX_BYTES = 8 << 20
+
+# Shared keep-alive session for the HEAD probes and the PDF download
+_SESSION = requests.Session()
+
+# Patterns applied to every line of the PDF text
+_REG_RE = re.compile(r'Total Registration and Turnout\s+(\d[\d,]*)\s+(\d[\d,]*)')
+_PRECINCT_RE = re.compile(r'\(\s*(\d+)\s+of\s+(\d+)\s+precincts reported\s*\)')
+
+# Lines that can never be contest headers: party prefixes (checked on line[:4]),
+# "No "/"Total " rows or bare numbers
+_PARTY_PREFIXES = frozenset(['DEM ', 'REP ', 'NON ', 'GRN ', 'LIB ', 'IND ', 'Yes '])
+_LINE_CLASS_RE = re.compile(r'(?:No|Total) |\d[\d,]*\s+[\d.]+%?\s*$')
+# Header/footer lines that are never candidates
+_NON_CANDIDATE_PREFIXES = ('Printed:', 'Data Refreshed:', 'CHI ', 'CITY OF CHICAGO', 'Page ')
+# Line following a contest header, and literals one of which it must contain
+_NEXT_LINE_RE = re.compile(r'^Vote For |\(.*precincts reported|precincts reported.*\(')
+_HEADER_ANCHORS = ('precincts reported', 'Vote For ')
 
 # PDF parsing libraries
 try:
     import pdfplumber
-    PDF_AVAILABLE = True
 except ImportError:
-    PDF_AVAILABLE = False
+    pdfplumber = None
+
+# PyMuPDF and PDFium extract text natively and much faster; pdfplumber is the fallback
+try:
+    import pymupdf
+except ImportError:
+    try:
+        import fitz as pymupdf  # Older PyMuPDF releases
+    except ImportError:
+        pymupdf = None
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+try:
+    import orjson  # Optional: much faster JSON encoding
+except ImportError:
+    orjson = None
+
+PDF_AVAILABLE = pdfplumber is not None or pdfium is not None or pymupdf is not None
+if not PDF_AVAILABLE:
     print("Warning: pdfplumber not installed. Install with: pip install pdfplumber")
 
+
+def _chars_to_text(chars: List[Dict], x_tolerance: float = 3, y_tolerance: float = 3) -> str:
+    """Rebuild page text from pdfplumber chars without layout analysis
+    
+    Chars whose tops fall within y_tolerance of each other form a line, read
+    left to right. A gap wider than x_tolerance or any run of whitespace
+    becomes a single space, matching page.extract_text() for simple layouts.
+    
+    Args:
+        chars: pdfplumber char dictionaries for one page
+        x_tolerance: Horizontal gap that separates words
+        y_tolerance: Vertical distance within which chars share a line
+        
+    Returns:
+        Page text with one line per row of characters
+    """
+    if not chars:
+        return ''
+    
+    # Group chars into lines by their top coordinate
+    rows = []
+    row = []
+    row_top = None
+    for char in sorted(chars, key=lambda c: c['top']):
+        top = char['top']
+        if row_top is not None and top - row_top > y_tolerance:
+            rows.append(row)
+            row = []
+            row_top = None
+        if row_top is None:
+            row_top = top
+        row.append(char)
+    rows.append(row)
+    
+    lines = []
+    for row in rows:
+        parts = []
+        pending_space = False
+        prev_x1 = None
+        for char in sorted(row, key=lambda c: c['x0']):
+            text = char['text']
+            if text.isspace():
+                pending_space = True
+                prev_x1 = char['x1']
+                continue
+            if prev_x1 is not None and char['x0'] - prev_x1 > x_tolerance:
+                pending_space = True
+            if pending_space and parts:
+                parts.append(' ')
+            pending_space = False
+            parts.append(text)
+            prev_x1 = char['x1']
+        lines.append(''.join(parts))
+    
+    return '\n'.join(lines)
+
+def _words_to_text(words: List[Tuple], y_tolerance: float = 3) -> str:
+    """Rebuild page text from PyMuPDF words, one line per row of words
+    
+    PyMuPDF's plain text mode puts widely spaced columns (name, votes,
+    percent) on separate lines, so rows are rebuilt from word positions.
+    
+    Args:
+        words: Tuples from page.get_text('words'): (x0, y0, x1, y1, text, ...)
+        y_tolerance: Vertical distance within which words share a line
+        
+    Returns:
+        Page text with one line per row of words
+    """
+    lines = []
+    row = []
+    row_top = None
+    for word in sorted(words, key=lambda w: w[1]):
+        if row_top is not None and word[1] - row_top > y_tolerance:
+            lines.append(' '.join(w[4] for w in sorted(row)))
+            row = []
+            row_top = None
+        if row_top is None:
+            row_top = word[1]
+        row.append(word)
+    if row:
+        lines.append(' '.join(w[4] for w in sorted(row)))
+    return '\n'.join(lines)
+
+def _pages_to_text(pages: List['pdfplumber.page.Page']) -> str:
+    """Extract text from pdfplumber pages, releasing each page's objects as it goes
+    
+    pdfplumber is opened without laparams, so pdfminer's layout analysis never
+    runs; only the raw chars are read.
+    
+    Args:
+        pages: pdfplumber pages in document order
+        
+    Returns:
+        Text of the pages, each page terminated by a newline
+    """
+    texts = []
+    for page in pages:
+        texts.append(_chars_to_text(page.chars) + '\n')
+        page.flush_cache()
+    return ''.join(texts)
+
+def _parse_int(text: str) -> int:
+    """Parse a count like '1,234', skipping the copy when there are no commas"""
+    return int(text.replace(',', '')) if ',' in text else int(text)
+
+def _build_candidates(rows: List[Tuple[Optional[str], str, str, str]]) -> List[Dict]:
+    """Convert raw (party prefix, name, votes, percent) fields into candidate dicts"""
+    return [
+        {
+            'name': name.strip(),
+            'votes': _parse_int(votes),
+            'percent': float(percent),
+            '_party_prefix': party_prefix
+        }
+        for party_prefix, name, votes, percent in rows
+    ]
+
+class _LineStream:
+    """Forward-only line reader over text with lookahead, push-back and anchor skipping"""
+    
+    def __init__(self, text: str):
+        self._text = text
+        self._pos = 0  # Start of the next unread line, or -1 at end of text
+        self._buffer = deque()  # Pushed-back lines, read before the text
+        self._anchor_hits = {anchor: text.find(anchor) for anchor in _HEADER_ANCHORS}
+    
+    def _read_line(self, advance: bool) -> Optional[str]:
+        pos = self._pos
+        if pos < 0:
+            return None
+        end = self._text.find('\n', pos)
+        if end == -1:
+            line, new_pos = self._text[pos:], -1
+        else:
+            line, new_pos = self._text[pos:end], end + 1
+        if advance:
+            self._pos = new_pos
+        return line
+    
+    def next(self) -> Optional[str]:
+        """Return the next line, or None at end of text"""
+        if self._buffer:
+            return self._buffer.popleft()
+        return self._read_line(True)
+    
+    def peek(self) -> Optional[str]:
+        """Return the next line without consuming it, or None at end of text"""
+        if self._buffer:
+            return self._buffer[0]
+        return self._read_line(False)
+    
+    def push_back(self, lines: List[str]):
+        """Return lines to the front of the stream, to be read again in order"""
+        self._buffer.extendleft(reversed(lines))
+    
+    def skip_to_next_anchor(self):
+        """Jump to the line just before the next line containing a header anchor
+        
+        A contest header is always followed by a line containing one of
+        _HEADER_ANCHORS, so no line skipped here can be a header. Does nothing
+        while pushed-back lines are pending.
+        """
+        pos = self._pos
+        if self._buffer or pos < 0:
+            return
+        
+        text = self._text
+        anchor_at = -1
+        for anchor, hit in self._anchor_hits.items():
+            if 0 <= hit < pos:
+                hit = text.find(anchor, pos)
+                self._anchor_hits[anchor] = hit
+            if hit >= 0 and (anchor_at < 0 or hit < anchor_at):
+                anchor_at = hit
+        
+        if anchor_at < 0:
+            # No anchors left, so no more headers
+            self._pos = -1
+            return
+        
+        line_start = text.rfind('\n', 0, anchor_at) + 1
+        header_start = text.rfind('\n', 0, line_start - 1) + 1 if line_start else 0
+        if header_start > pos:
+            self._pos = header_start
+
 class ChicagoBoardScraper:
     """Scraper for Chicago Board of Election Commissioners results"""
     
@@ -100,30 +329,35 @@ class ChicagoBoardScraper:
         Returns:
             Dictionary with scraped results
         """
+        scraped_at = datetime.now().isoformat()
+        
         if not PDF_AVAILABLE:
             return {
                 'error': 'pdfplumber not installed',
                 'message': 'Install with: pip install pdfplumber',
                 'authority': self.authority,
-                'scraped_at': datetime.now().isoformat()
+                'scraped_at': scraped_at
             }
         
         print(f"Scraping {self.authority}...")
         print(f"PDF URL: {pdf_url}")
         
         try:
-            # Fetch PDF
-            response = requests.get(pdf_url, timeout=60)
-            response.raise_for_status()
-            
-            # Parse PDF
-            pdf_file = io.BytesIO(response.content)
-            results = self._parse_pdf(pdf_file)
+            # Stream the PDF into a spooled file instead of buffering it twice
+            with tempfile.SpooledTemporaryFile(max_size=PDF_SPOOL_MAX_BYTES) as pdf_file:
+                with _SESSION.get(pdf_url, stream=True, timeout=60) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        pdf_file.write(chunk)
+                pdf_file.seek(0)
+                
+                # Parse PDF
+                results = self._parse_pdf(pdf_file)
             
             results['authority'] = self.authority
             results['jurisdiction'] = self.county_name
             results['election_date'] = self.election_date
-            results['scraped_at'] = datetime.now().isoformat()
+            results['scraped_at'] = scraped_at
             results['source'] = 'Chicago Board PDF'
             results['pdf_url'] = pdf_url
             
@@ -135,7 +369,7 @@ class ChicagoBoardScraper:
             return {
                 'error': str(e),
                 'authority': self.authority,
-                'scraped_at': datetime.now().isoformat()
+                'scraped_at': scraped_at
             }
     
     def scrape_summary_report(self) -> Dict:
@@ -144,19 +378,31 @@ class ChicagoBoardScraper:
         Returns:
             Dictionary with scraped results
         """
-        # Try common PDF URLs
-        for pdf_name in self.summary_pdf_names:
-            pdf_url = f"{self.results_base}/{pdf_name}"
-            
+        # Probe all common PDF URLs at once
+        pdf_urls = [f"{self.results_base}/{pdf_name}" for pdf_name in self.summary_pdf_names]
+        executor = ThreadPoolExecutor(max_workers=len(pdf_urls))
+        futures = []
+        for pdf_url in pdf_urls:
             print(f"Trying: {pdf_url}")
+            futures.append(executor.submit(_SESSION.head, pdf_url, timeout=10))
+        
+        # Check in list order so the preferred filename still wins
+        found_url = None
+        for pdf_url, future in zip(pdf_urls, futures):
             try:
-                response = requests.head(pdf_url, timeout=10)
-                if response.status_code == 200:
-                    print(f"✓ Found PDF at: {pdf_url}")
-                    return self.scrape_from_pdf_url(pdf_url)
-            except:
+                if future.result().status_code == 200:
+                    found_url = pdf_url
+                    break
+            except Exception:
                 continue
         
+        # Don't wait on probes whose answer no longer matters
+        executor.shutdown(wait=False, cancel_futures=True)
+        
+        if found_url:
+            print(f"✓ Found PDF at: {found_url}")
+            return self.scrape_from_pdf_url(found_url)
+        
         # If no PDF found, return error with instructions
         return {
             'error': 'PDF not found',
@@ -166,11 +412,11 @@ class ChicagoBoardScraper:
             'scraped_at': datetime.now().isoformat()
         }
     
-    def _parse_pdf(self, pdf_file: io.BytesIO) -> Dict:
+    def _parse_pdf(self, pdf_file: BinaryIO) -> Dict:
         """Parse Chicago Board PDF format
         
         Args:
-            pdf_file: BytesIO object containing PDF data
+            pdf_file: Seekable binary file object containing PDF data
             
         Returns:
             Normalized results dictionary
@@ -180,11 +426,7 @@ class ChicagoBoardScraper:
             'summary': {}
         }
         
-        with pdfplumber.open(pdf_file) as pdf:
-            # Extract text from all pages
-            full_text = ''
-            for page in pdf.pages:
-                full_text += page.extract_text() + '\n'
+        full_text = self._extract_text(pdf_file)
         
         # Parse summary statistics from first page
         self._parse_summary_stats(full_text, results)
@@ -194,6 +436,42 @@ class ChicagoBoardScraper:
         
         return results
     
+    def _extract_text(self, pdf_file: BinaryIO) -> str:
+        """Extract the text of every page, one line per text row
+        
+        Uses PyMuPDF or PDFium when available and falls back to pdfplumber.
+        
+        Args:
+            pdf_file: Seekable binary file object containing PDF data
+            
+        Returns:
+            Text of all pages, each page terminated by a newline
+        """
+        if pymupdf is not None:
+            doc = pymupdf.open(stream=pdf_file.read(), filetype='pdf')
+            try:
+                return ''.join(_words_to_text(page.get_text('words')) + '\n' for page in doc)
+            finally:
+                doc.close()
+        
+        if pdfium is not None:
+            doc = pdfium.PdfDocument(pdf_file)
+            try:
+                pages = []
+                for page in doc:
+                    textpage = page.get_textpage()
+                    pages.append('\n'.join(textpage.get_text_range().splitlines()) + '\n')
+                    textpage.close()
+                    page.close()
+                return ''.join(pages)
+            finally:
+                doc.close()
+        
+        with pdfplumber.open(pdf_file) as pdf:
+            # Extract text from all pages straight from the character stream;
+            # the Chicago layout is a single column, so no layout analysis is needed
+            return _pages_to_text(pdf.pages)
+    
     def _parse_summary_stats(self, text: str, results: Dict):
         """Extract summary statistics from PDF text
         
@@ -202,13 +480,13 @@ class ChicagoBoardScraper:
             results: Results dictionary to update
         """
         # Look for "Total Registration and Turnout" line
-        reg_match = re.search(r'Total Registration and Turnout\s+(\d[\d,]*)\s+(\d[\d,]*)', text)
+        reg_match = _REG_RE.search(text)
         if reg_match:
-            results['summary']['registered_voters'] = int(reg_match.group(1).replace(',', ''))
-            results['summary']['total_votes_cast'] = int(reg_match.group(2).replace(',', ''))
+            results['summary']['registered_voters'] = _parse_int(reg_match.group(1))
+            results['summary']['total_votes_cast'] = _parse_int(reg_match.group(2))
         
         # Look for precinct count
-        precinct_match = re.search(r'\(\s*(\d+)\s+of\s+(\d+)\s+precincts reported\s*\)', text)
+        precinct_match = _PRECINCT_RE.search(text)
         if precinct_match:
             results['summary']['precincts_reporting'] = int(precinct_match.group(1))
             results['summary']['total_precincts'] = int(precinct_match.group(2))
@@ -227,160 +505,165 @@ class ChicagoBoardScraper:
             text: Full PDF text
             results: Results dictionary to update
         """
-        # Split text into lines
-        lines = text.split('\n')
-        
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
+        stream = _LineStream(text)
+        contests = results['contests']
+        
+        # Bound once: these run for every line of the PDF
+        next_line = stream.next
+        peek = stream.peek
+        skip_to_next_anchor = stream.skip_to_next_anchor
+        is_contest_header = self._is_contest_header
+        
+        while True:
+            # Jump over runs of lines that cannot be contest headers
+            skip_to_next_anchor()
+            raw_line = next_line()
+            if raw_line is None:
+                break
+            line = raw_line.strip()
             
-            # Skip empty lines and header/footer
-            if not line or 'Printed:' in line or 'Data Refreshed:' in line or 'Page ' in line:
-                i += 1
+            # Skip empty lines
+            if not line:
                 continue
             
             # Check if this line looks like a contest name
-            # Contest names are typically all caps or Title Case, not starting with DEM/REP/NON
-            if self._is_contest_header(line, lines, i):
-                contest = self._parse_single_contest(lines, i)
-                if contest and contest.get('candidates'):
-                    results['contests'].append(contest)
-                    # Skip past the lines we just parsed
-                    i += contest.get('_lines_consumed', 1)
+            # Contest names are typically all caps or Title Case, not starting with DEM/REP/NON.
+            # Header/footer lines are ruled out only for the rare lines that pass.
+            if is_contest_header(line, peek()):
+                if 'Printed:' in line or 'Data Refreshed:' in line or 'Page ' in line:
+                    continue
+                contest, consumed = self._parse_single_contest(line, stream)
+                if contest:
+                    contests.append(contest)
                 else:
-                    i += 1
-            else:
-                i += 1
+                    # Nothing parsed; rescan the lines after this header
+                    stream.push_back(consumed)
     
-    def _is_contest_header(self, line: str, lines: List[str], index: int) -> bool:
+    def _is_contest_header(self, line: str, next_line: Optional[str]) -> bool:
         """Check if a line is a contest header
         
         Args:
-            line: Current line
-            lines: All lines
-            index: Current index
+            line: Current line (stripped)
+            next_line: Following line, or None at end of text
             
         Returns:
             True if this is a contest header
         """
-        # Skip if starts with party prefix
-        if line.startswith(('DEM ', 'REP ', 'NON ', 'GRN ', 'LIB ', 'IND ', 'Yes ', 'No ', 'Total ')):
+        # A header is followed by a precinct reporting or "Vote For" line;
+        # test that first since it rules out nearly every line
+        if next_line is None or not _NEXT_LINE_RE.search(next_line.strip()):
             return False
         
-        # Skip if it's numbers/percentages
-        if re.match(r'^\d[\d,]*\s+[\d.]+%?\s*$', line):
+        # Skip if starts with party prefix or is numbers/percentages
+        if line[:4] in _PARTY_PREFIXES:
             return False
-        
-        # Look ahead for precinct reporting line
-        if index + 1 < len(lines):
-            next_line = lines[index + 1].strip()
-            if '(' in next_line and 'precincts reported' in next_line:
-                return True
-        
-        # Or look for "Vote For" pattern (multi-winner contests)
-        if index + 1 < len(lines):
-            next_line = lines[index + 1].strip()
-            if next_line.startswith('Vote For '):
-                return True
-        
-        return False
+        return _LINE_CLASS_RE.match(line) is None
     
-    def _parse_single_contest(self, lines: List[str], start_index: int) -> Optional[Dict]:
-        """Parse a single contest from lines
+    def _parse_single_contest(self, contest_name: str, stream: '_LineStream') -> Tuple[Optional[Dict], List[str]]:
+        """Parse a single contest from the lines following its header
         
         Args:
-            lines: All text lines
-            start_index: Index where contest starts
+            contest_name: Contest header line (stripped)
+            stream: Line stream positioned just after the header
             
         Returns:
-            Contest dictionary or None
+            Tuple of (contest dictionary or None, raw lines read from the stream)
         """
-        contest_name = lines[start_index].strip()
-        
         contest = {
             'name': contest_name,
             'party': 'Unknown',  # Will be determined from candidates
-            'candidates': [],
-            '_lines_consumed': 1
+            'candidates': []
         }
-        
-        i = start_index + 1
+        consumed = []
+        rows = []
         
         # Check for "Vote For X" line
-        if i < len(lines) and lines[i].strip().startswith('Vote For '):
-            i += 1
-            contest['_lines_consumed'] += 1
+        next_line = stream.peek()
+        if next_line is not None and next_line.strip().startswith('Vote For '):
+            consumed.append(stream.next())
         
         # Check for precinct reporting line
-        if i < len(lines):
-            precinct_line = lines[i].strip()
-            precinct_match = re.search(r'\(\s*(\d+)\s+of\s+(\d+)\s+precincts reported\s*\)', precinct_line)
+        next_line = stream.peek()
+        if next_line is not None:
+            precinct_match = _PRECINCT_RE.search(next_line.strip())
             if precinct_match:
                 contest['precincts_reporting'] = int(precinct_match.group(1))
                 contest['total_precincts'] = int(precinct_match.group(2))
-                i += 1
-                contest['_lines_consumed'] += 1
+                consumed.append(stream.next())
         
         # Parse candidates until we hit "Total" line
-        while i < len(lines):
-            line = lines[i].strip()
+        next_line = stream.next
+        peek = stream.peek
+        is_contest_header = self._is_contest_header
+        split_candidate_line = self._split_candidate_line
+        while True:
+            raw_line = next_line()
+            if raw_line is None:
+                break
+            line = raw_line.strip()
             
             # Stop at Total line
             if line.startswith('Total ') or line == 'Total':
-                contest['_lines_consumed'] += 1
+                consumed.append(raw_line)
                 break
             
-            # Stop at next contest (new header)
-            if self._is_contest_header(line, lines, i):
+            # Stop at next contest (new header); leave it for the caller
+            if is_contest_header(line, peek()):
+                stream.push_back([raw_line])
                 break
             
-            # Try to parse as candidate line
-            candidate = self._parse_candidate_line(line)
-            if candidate:
-                contest['candidates'].append(candidate)
+            consumed.append(raw_line)
+            
+            # Try to split as candidate line; numbers are converted once at the end
+            fields = split_candidate_line(line)
+            if fields:
+                rows.append(fields)
                 # Determine party from first candidate if not set
                 if contest['party'] == 'Unknown':
                     contest['party'] = self.detect_party(contest_name, line)
-            
-            i += 1
-            contest['_lines_consumed'] += 1
         
-        return contest if contest['candidates'] else None
+        if not rows:
+            return None, consumed
+        contest['candidates'] = _build_candidates(rows)
+        return contest, consumed
     
-    def _parse_candidate_line(self, line: str) -> Optional[Dict]:
-        """Parse a candidate line
+    def _split_candidate_line(self, line: str) -> Optional[Tuple[Optional[str], str, str, str]]:
+        """Split a candidate line into its raw text fields
         
         Format: PARTY - Candidate Name   votes   percent%
         or: Candidate Name   votes   percent%
         
         Args:
-            line: Line to parse
+            line: Line to split (already stripped)
             
         Returns:
-            Candidate dictionary or None
+            Tuple of (party prefix or None, name, votes, percent) strings, or None
         """
         # Skip non-candidate lines
-        if not line or line.startswith(('Printed:', 'Data Refreshed:', 'CHI ', 'CITY OF CHICAGO', 'Page ')):
+        if not line or line.startswith(_NON_CANDIDATE_PREFIXES):
             return None
         
-        # Pattern: PARTY - Name  votes  percent%
-        # or: Name  votes  percent%
-        match = re.match(r'^(?:([A-Z]{3})\s+-\s+)?(.+?)\s+(\d[\d,]*)\s+([\d.]+)%?\s*$', line)
-        
-        if match:
-            party_prefix = match.group(1)  # May be None
-            name = match.group(2).strip()
-            votes = int(match.group(3).replace(',', ''))
-            percent = float(match.group(4))
-            
-            return {
-                'name': name,
-                'votes': votes,
-                'percent': percent,
-                '_party_prefix': party_prefix
-            }
+        # Scan right to left: percent, votes, then the name with optional party
+        fields = line.rsplit(None, 2)
+        if len(fields) != 3:
+            return None
+        name, votes, percent = fields
+        if percent[-1] == '%':
+            percent = percent[:-1]
+        if not percent or percent.strip('0123456789.') or votes[0] == ',' or votes.strip('0123456789,'):
+            return None
         
-        return None
+        # Optional "XXX - " party prefix, kept only if a name follows it
+        party_prefix = None
+        head = name[:3]
+        if head.isupper() and head.isalpha() and head.isascii() and name[3:4].isspace():
+            after = name[3:].lstrip()
+            if after[:1] == '-' and after[1:2].isspace():
+                candidate_name = after[1:].lstrip()
+                if candidate_name:
+                    party_prefix, name = head, candidate_name
+        
+        return party_prefix, name, votes, percent
     
     def save_results(self, results: Dict, output_dir: str = '.'):
         """Save results to JSON file
@@ -391,8 +674,12 @@ class ChicagoBoardScraper:
         """
         filename = f"{output_dir}/chicago_board_results.json"
         
-        with open(filename, 'w') as f:
-            json.dump(results, f, indent=2)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(results, f, indent=2)
         
         print(f"✓ Saved results to {filename}")
 
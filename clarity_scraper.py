@@ -5,12 +5,32 @@ Supports: Will, McHenry, Lake, Kankakee, Winnebago (County & City of Rockford)
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Optional
-import time
+from typing import Dict, List, Optional, Tuple
 import sys
 
+try:
+    import orjson  # Optional: much faster JSON parsing and encoding
+except ImportError:
+    orjson = None
+
+# Concurrent county scrapes in scrape_all_clarity_counties
+MAX_COUNTY_WORKERS = 8
+
+# Last response per URL as (conditional request headers, parsed JSON). Kept for
+# the life of the process so repeat polls can be answered with 304 Not Modified.
+_RESPONSE_CACHE: Dict[str, Tuple[Dict[str, str], Dict]] = {}
+
+
+# Keep-alive session shared by every scraper in the process so polls and
+# counties reuse connections. All Clarity counties are served from the same
+# host, so its pool is sized for every concurrent county fetch.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=50, pool_maxsize=50))
+
 
 class ClarityElectionsScraper:
     """Scraper for Clarity Elections platform used by multiple Illinois counties"""
@@ -31,16 +51,32 @@ class ClarityElectionsScraper:
         self.county_name = county_name
         self.json_base = f"{base_url}/{election_id}/{web_id}/json/en"
         
+        # Keep-alive session so repeated fetches reuse the TLS connection
+        self.session = _SESSION
+        
     def fetch_json(self, endpoint: str) -> Optional[Dict]:
         """Fetch JSON data from an endpoint"""
         url = f"{self.json_base}/{endpoint}"
+        cached = _RESPONSE_CACHE.get(url)
         try:
-            response = requests.get(url, timeout=10)
+            response = self.session.get(url, timeout=10, headers=cached[0] if cached else None)
+            if response.status_code == 304 and cached:
+                return cached[1]
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            data = orjson.loads(response.content) if orjson is not None else response.json()
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"Error fetching {url}: {e}")
             return None
+        
+        # Remember validators so the next poll can revalidate instead of re-downloading
+        validators = {}
+        if 'ETag' in response.headers:
+            validators['If-None-Match'] = response.headers['ETag']
+        if 'Last-Modified' in response.headers:
+            validators['If-Modified-Since'] = response.headers['Last-Modified']
+        if validators:
+            _RESPONSE_CACHE[url] = (validators, data)
+        return data
     
     def get_election_settings(self) -> Optional[Dict]:
         """Get election metadata and settings"""
@@ -136,9 +172,6 @@ class ClarityElectionsScraper:
             # Parse the contest
             contest_data = self.parse_contest(contest)
             contests.append(contest_data)
-            
-            # Small delay to be respectful
-            time.sleep(0.1)
         
         print(f"✅ Completed scraping {len(contests)} contests for {self.county_name}")
         return contests
@@ -176,8 +209,12 @@ class ClarityElectionsScraper:
             }
         }
         
-        with open(filename, 'w') as f:
-            json.dump(output, f, indent=2)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(output, f, indent=2)
         
         print(f"✅ Results saved to {filename}")
         print(f"   - Democratic: {output['summary']['democratic_contests']} contests")
@@ -266,13 +303,27 @@ def scrape_all_clarity_counties(config_path: str = 'config.json'):
         print(f"  - {county}")
     print()
     
-    # Scrape each county
+    # Scrape counties concurrently over the shared session; each one is bound
+    # by network round-trips
     all_results = {}
-    for county_name in clarity_counties:
-        results = scrape_clarity_county(county_name, config_path)
-        if results:
-            all_results[county_name] = results
-        print()  # Blank line between counties
+    if clarity_counties:
+        with ThreadPoolExecutor(max_workers=min(MAX_COUNTY_WORKERS, len(clarity_counties))) as executor:
+            futures = {
+                executor.submit(scrape_clarity_county, county_name, config_path): county_name
+                for county_name in clarity_counties
+            }
+            for future in as_completed(futures):
+                county_name = futures[future]
+                try:
+                    results = future.result()
+                except Exception as e:
+                    print(f"❌ Error scraping {county_name}: {e}")
+                    continue
+                if results:
+                    all_results[county_name] = results
+    
+    # Report in configuration order regardless of completion order
+    all_results = {county: all_results[county] for county in clarity_counties if county in all_results}
     
     # Print summary
     print(f"\n{'='*60}")
@@ -19,24 +19,89 @@ For March 17, 2026 Primary, results URL will be: resultsMMYY.cookcountyclerkil.g
 
 import requests
 from bs4 import BeautifulSoup
+import functools
+import gc
 import json
 import re
 import sys
 import zipfile
-import io
+import hashlib
+import shutil
+import tempfile
 from datetime import datetime
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence
 import openpyxl
 
+from output_formats import OUTPUT_FORMATS, parquet_available, write_results
+
+try:
+    import lxml  # noqa: F401  Optional: much faster HTML parser for BeautifulSoup
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+try:
+    from python_calamine import CalamineWorkbook  # Optional: much faster Rust-backed reader
+except ImportError:
+    CalamineWorkbook = None
+
+# Office keywords that mark a contest header (substring match on upper-cased text)
+_OFFICE_RE = re.compile(
+    'PRESIDENT|SENATOR|REPRESENTATIVE|GOVERNOR|CONGRESS|ASSEMBLY|HOUSE|SENATE|JUDGE|'
+    'BOARD|COMMISSIONER|CLERK|TREASURER|ATTORNEY|DISTRICT|TOWNSHIP|COUNTY|STATE'
+)
+
+# Workbooks smaller than this are unzipped into memory; larger ones spill to a temp file
+WORKBOOK_SPOOL_MAX_BYTES = 64 << 20
+
+# Parsed canvasses are cached next to this script unless a cache_dir is given.
+# Bump _CACHE_VERSION whenever _parse_excel_sheet's output changes so stale
+# entries from an older parser are not served.
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / '.cache' / 'cook'
+_CACHE_VERSION = 1
+
+# Numeric cell handling: a count needs a digit; thousands separators and % are dropped
+_DIGIT_RE = re.compile(r'\d')
+_NUM_STRIP = str.maketrans('', '', ',%')
+
+@functools.lru_cache(maxsize=4096)
+def _detect_party(contest_name: str) -> str:
+    """Cached party detection; contest names repeat across precinct sheets"""
+    contest_upper = contest_name.upper()
+    
+    # Cook County often labels races as "DEM" or "REP" prefix
+    if contest_upper.startswith('DEM ') or 'DEMOCRATIC' in contest_upper:
+        return 'Democratic'
+    elif contest_upper.startswith('REP ') or 'REPUBLICAN' in contest_upper:
+        return 'Republican'
+    else:
+        return 'Non-Partisan'
+
+def _int_first_cells(rows: Iterable[list]) -> Iterator[list]:
+    """Give calamine rows integer first cells where openpyxl would
+    
+    calamine reads every number as a float, so a first cell of 12 would
+    otherwise become the text '12.0' rather than '12'.
+    """
+    for row in rows:
+        if row:
+            first = row[0]
+            if type(first) is float and first.is_integer():
+                row[0] = int(first)
+        yield row
+
 class CookCountyClerkScraper:
     """Scraper for Cook County Clerk election results"""
     
-    def __init__(self, election_code: Optional[str] = None):
+    def __init__(self, election_code: Optional[str] = None, cache_dir: Optional[str] = None):
         """Initialize scraper
         
         Args:
             election_code: Election code (e.g., '0326' for March 2026)
                           If None, must be provided later or use manual download
+            cache_dir: Where parsed canvasses are cached (default: .cache/cook
+                       next to this script)
         """
         self.election_code = election_code or 'UPDATE_ON_ELECTION_DAY'
         self.authority_name = 'Cook County Clerk'
@@ -53,6 +118,9 @@ class CookCountyClerkScraper:
             print("   It will be: resultsMMYY.cookcountyclerkil.gov (e.g., results0326.cookcountyclerkil.gov)")
             print()
         
+        # Parsed canvasses, keyed by a hash of the ZIP contents
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        
         # Base URLs
         self.base_url = 'https://www.cookcountyclerkil.gov'
         self.data_url = f'{self.base_url}/elections/results-and-election-data/election-data/precinct-canvasses'
@@ -66,27 +134,29 @@ class CookCountyClerkScraper:
         Returns:
             Party string: 'Democratic', 'Republican', or 'Non-Partisan'
         """
-        contest_upper = contest_name.upper()
-        
-        # Cook County often labels races as "DEM" or "REP" prefix
-        if contest_upper.startswith('DEM ') or 'DEMOCRATIC' in contest_upper:
-            return 'Democratic'
-        elif contest_upper.startswith('REP ') or 'REPUBLICAN' in contest_upper:
-            return 'Republican'
-        else:
-            return 'Non-Partisan'
+        return _detect_party(contest_name)
     
-    def parse_excel_from_zip(self, zip_path: str) -> Dict:
+    def parse_excel_from_zip(self, zip_path: str, use_cache: bool = True) -> Dict:
         """Parse election results from Excel file in ZIP archive
         
         Cook County provides precinct canvasses as ZIP files containing Excel spreadsheets.
+        A ZIP that was already parsed is served from the cache in self.cache_dir.
         
         Args:
             zip_path: Path to downloaded ZIP file
+            use_cache: Reuse (and store) parsed results keyed by the ZIP's content hash
             
         Returns:
             Dictionary with parsed results
         """
+        cache_path = self._zip_cache_path(zip_path) if use_cache else None
+        if cache_path is not None:
+            cached = self._load_cached_results(cache_path)
+            if cached is not None:
+                print(f"✓ Loaded {len(cached.get('contests', []))} contests from cache: {cache_path}")
+                cached['scraped_at'] = datetime.now().isoformat()
+                return cached
+        
         results = {
             'contests': [],
             'summary': {},
@@ -98,6 +168,10 @@ class CookCountyClerkScraper:
         
         print(f"Parsing Excel file from ZIP: {zip_path}")
         
+        # The parse allocates many acyclic, long-lived objects; skip the
+        # cyclic GC passes they would trigger until it is done
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
         try:
             with zipfile.ZipFile(zip_path, 'r') as zip_ref:
                 # Find Excel files in ZIP
@@ -113,16 +187,17 @@ class CookCountyClerkScraper:
                 excel_file = excel_files[0]
                 print(f"Processing: {excel_file}")
                 
-                # Read Excel file from ZIP
-                with zip_ref.open(excel_file) as f:
-                    workbook = openpyxl.load_workbook(io.BytesIO(f.read()))
+                # Copy the Excel file out of the ZIP into a seekable spooled file;
+                # small workbooks stay in memory, large ones spill to disk
+                with zip_ref.open(excel_file) as f, \
+                        tempfile.SpooledTemporaryFile(max_size=WORKBOOK_SPOOL_MAX_BYTES) as workbook_file:
+                    shutil.copyfileobj(f, workbook_file, 1 << 20)
+                    workbook_file.seek(0)
                     
                     # Process each sheet (often one sheet per contest or category)
-                    for sheet_name in workbook.sheetnames:
-                        sheet = workbook[sheet_name]
-                        
+                    for sheet_name, rows in self._iter_workbook_rows(workbook_file):
                         # Extract contests from this sheet
-                        contests = self._parse_excel_sheet(sheet, sheet_name)
+                        contests = self._parse_excel_sheet(rows, sheet_name)
                         results['contests'].extend(contests)
                 
                 print(f"✓ Extracted {len(results['contests'])} contests")
@@ -130,10 +205,77 @@ class CookCountyClerkScraper:
         except Exception as e:
             print(f"✗ Error parsing ZIP file: {e}")
             results['error'] = str(e)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        
+        if cache_path is not None and 'error' not in results:
+            self._save_cached_results(cache_path, results)
         
         return results
     
-    def _parse_excel_sheet(self, sheet, sheet_name: str) -> List[Dict]:
+    def _zip_cache_path(self, zip_path: str) -> Optional[Path]:
+        """Cache file for a ZIP, named by a BLAKE2 hash of its contents
+        
+        The parser version and workbook reader are part of the name, so a
+        parser change or a different reader never serves an old result.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        try:
+            with open(zip_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(chunk)
+        except OSError:
+            return None  # Let the parse report the problem
+        backend = 'calamine' if CalamineWorkbook is not None else 'openpyxl'
+        return self.cache_dir / f"{digest.hexdigest()}-v{_CACHE_VERSION}-{backend}.json"
+    
+    def _load_cached_results(self, cache_path: Path) -> Optional[Dict]:
+        """Return previously parsed results, or None if not cached"""
+        try:
+            with open(cache_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _save_cached_results(self, cache_path: Path, results: Dict):
+        """Best-effort write of parsed results to the cache"""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, 'w') as f:
+                json.dump(results, f)
+        except OSError:
+            pass  # Unwritable location - parse the ZIP again next time
+    
+    def _iter_workbook_rows(self, workbook_file: BinaryIO):
+        """Yield (sheet_name, rows) for each sheet of an Excel workbook
+        
+        Uses python-calamine when installed, otherwise openpyxl in read-only
+        mode (rows stream from the sheet XML and only cached values are read).
+        
+        Args:
+            workbook_file: Seekable binary file object holding the workbook
+            
+        Yields:
+            Tuples of (sheet name, iterable of row value sequences)
+        """
+        if CalamineWorkbook is not None:
+            workbook = CalamineWorkbook.from_filelike(workbook_file)
+            for sheet_name in workbook.sheet_names:
+                # Keep leading empty rows/columns so row[0] is column A, as with openpyxl
+                rows = workbook.get_sheet_by_name(sheet_name).to_python(skip_empty_area=False)
+                yield sheet_name, _int_first_cells(rows)
+            return
+        
+        workbook = openpyxl.load_workbook(workbook_file, read_only=True,
+                                          data_only=True, keep_links=False)
+        try:
+            for sheet_name in workbook.sheetnames:
+                yield sheet_name, workbook[sheet_name].iter_rows(values_only=True)
+        finally:
+            workbook.close()
+    
+    def _parse_excel_sheet(self, rows: Iterable[Sequence], sheet_name: str) -> List[Dict]:
         """Parse contests from an Excel sheet
         
         Cook County Excel format varies, but typically has:
@@ -142,7 +284,7 @@ class CookCountyClerkScraper:
         - Totals and percentages
         
         Args:
-            sheet: openpyxl worksheet
+            rows: Row value sequences for the sheet (empty cells as None or '')
             sheet_name: Name of the sheet
             
         Returns:
@@ -152,17 +294,22 @@ class CookCountyClerkScraper:
         current_contest = None
         
         # Iterate through rows
-        for row_idx, row in enumerate(sheet.iter_rows(values_only=True), start=1):
+        for row_idx, row in enumerate(rows, start=1):
             # Skip empty rows
             if not any(row):
                 continue
             
-            # Convert row to list of strings
-            row_values = [str(cell) if cell is not None else '' for cell in row]
-            first_cell = row_values[0].strip() if row_values else ''
+            # Only the first cell is needed as text; numeric cells stay numeric
+            first = row[0] if row else None
+            if first is None:
+                first_cell = ''
+            else:
+                first_cell = first.strip() if isinstance(first, str) else str(first)
+            # Upper-cased once and shared by the header and TOTAL checks
+            first_cell_upper = first_cell.upper()
             
             # Detect contest headers (typically all caps or contains specific keywords)
-            if self._is_contest_header(first_cell):
+            if self._is_contest_header(first_cell, first_cell_upper):
                 # Save previous contest
                 if current_contest and current_contest.get('candidates'):
                     contests.append(current_contest)
@@ -176,29 +323,48 @@ class CookCountyClerkScraper:
                 }
             
             # Detect candidate rows (have name + numbers)
-            elif current_contest and len(row_values) >= 2:
+            elif current_contest and len(row) >= 2:
                 candidate_name = first_cell
                 
                 # Skip if looks like a header or total
-                if not candidate_name or 'TOTAL' in candidate_name.upper():
+                if not candidate_name or 'TOTAL' in first_cell_upper:
                     continue
                 
                 # Look for vote count (numeric value in row)
                 votes = 0
                 percent = 0.0
                 
-                for cell in row_values[1:]:
-                    # Try to parse as number
-                    try:
-                        val = float(str(cell).replace(',', '').replace('%', ''))
-                        # If it has decimal, might be percentage
-                        if '%' in str(cell) or (val < 100 and val > 0):
-                            percent = val
-                        # Otherwise it's votes
-                        elif val >= 1:
-                            votes = int(val)
-                    except ValueError:
-                        continue
+                # Walk the remaining cells in place rather than copying row[1:]
+                cells = iter(row)
+                next(cells)
+                for cell in cells:
+                    cell_type = type(cell)
+                    if cell_type is int or cell_type is float:
+                        # Numeric cells are used directly; no text round-trip
+                        val = float(cell)
+                        is_percent = False
+                    else:
+                        if cell is None:
+                            continue
+                        cell = str(cell)
+                        
+                        # Cells without a digit can't be counts; skip the failing float()
+                        if not _DIGIT_RE.search(cell):
+                            continue
+                        
+                        # Try to parse as number
+                        try:
+                            val = float(cell.translate(_NUM_STRIP))
+                        except ValueError:
+                            continue
+                        is_percent = '%' in cell
+                    
+                    # If it has decimal, might be percentage
+                    if is_percent or 0 < val < 100:
+                        percent = val
+                    # Otherwise it's votes
+                    elif val >= 1:
+                        votes = int(val)
                 
                 # Add candidate if we have votes
                 if candidate_name and votes > 0:
@@ -214,11 +380,12 @@ class CookCountyClerkScraper:
         
         return contests
     
-    def _is_contest_header(self, text: str) -> bool:
+    def _is_contest_header(self, text: str, text_upper: Optional[str] = None) -> bool:
         """Determine if text is a contest header
         
         Args:
             text: Text to check
+            text_upper: text.upper(), if the caller already has it
             
         Returns:
             True if this appears to be a contest name
@@ -231,23 +398,14 @@ class CookCountyClerkScraper:
         # - Contain office names
         # - Don't start with numbers
         
-        text_upper = text.upper()
-        
-        # Office keywords
-        office_keywords = [
-            'PRESIDENT', 'SENATOR', 'REPRESENTATIVE', 'GOVERNOR', 
-            'CONGRESS', 'ASSEMBLY', 'HOUSE', 'SENATE', 'JUDGE',
-            'BOARD', 'COMMISSIONER', 'CLERK', 'TREASURER', 'ATTORNEY',
-            'DISTRICT', 'TOWNSHIP', 'COUNTY', 'STATE'
-        ]
-        
         # Check if contains office keyword
-        has_keyword = any(keyword in text_upper for keyword in office_keywords)
+        if text_upper is None:
+            text_upper = text.upper()
+        if _OFFICE_RE.search(text_upper):
+            return True
         
         # Check if mostly uppercase (indicating header)
-        mostly_upper = sum(1 for c in text if c.isupper()) > len(text) * 0.5
-        
-        return has_keyword or (mostly_upper and len(text) > 10)
+        return len(text) > 10 and sum(map(str.isupper, text)) > len(text) * 0.5
     
     def scrape_web_results(self) -> Dict:
         """Scrape results from web interface
@@ -275,7 +433,8 @@ class CookCountyClerkScraper:
             })
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # Pass bytes so the parser detects the encoding itself
+            soup = BeautifulSoup(response.content, HTML_PARSER)
             
             # Parse results (format varies by election)
             # This is a placeholder - actual parsing would depend on page structure
@@ -299,18 +458,15 @@ class CookCountyClerkScraper:
                 'scraped_at': datetime.now().isoformat()
             }
     
-    def save_results(self, results: Dict, output_dir: str = '.'):
-        """Save results to JSON file
+    def save_results(self, results: Dict, output_dir: str = '.', output_format: str = 'json'):
+        """Save results to disk
         
         Args:
             results: Results dictionary
             output_dir: Directory to save file
+            output_format: 'json', 'jsonl' or 'parquet' (see output_formats)
         """
-        filename = f"{output_dir}/cook_clerk_results.json"
-        
-        with open(filename, 'w') as f:
-            json.dump(results, f, indent=2)
-        
+        filename = write_results(results, f"{output_dir}/cook_clerk_results", output_format)
         print(f"✓ Saved results to {filename}")
 
 def print_instructions():
@@ -349,19 +505,26 @@ def main():
     parser.add_argument('--zip', help='Path to downloaded ZIP file with Excel results')
     parser.add_argument('--code', help='Election code (e.g., 0326 for March 2026)')
     parser.add_argument('--output', default='.', help='Output directory for JSON results')
+    parser.add_argument('--format', dest='output_format', choices=OUTPUT_FORMATS, default='json',
+                        help='Output format: indented JSON, JSON Lines, or Parquet (needs pyarrow)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Re-parse the ZIP even if it was parsed before')
+    parser.add_argument('--cache-dir', help='Directory for parsed ZIP results (default: .cache/cook next to this script)')
     
     args = parser.parse_args()
+    if args.output_format == 'parquet' and not parquet_available():
+        parser.error('--format parquet needs pyarrow (pip install pyarrow)')
     
     if args.zip:
         # Parse Excel from ZIP
-        scraper = CookCountyClerkScraper()
-        results = scraper.parse_excel_from_zip(args.zip)
-        scraper.save_results(results, args.output)
+        scraper = CookCountyClerkScraper(cache_dir=args.cache_dir)
+        results = scraper.parse_excel_from_zip(args.zip, use_cache=not args.no_cache)
+        scraper.save_results(results, args.output, args.output_format)
     elif args.code:
         # Try web scraping
         scraper = CookCountyClerkScraper(args.code)
         results = scraper.scrape_web_results()
-        scraper.save_results(results, args.output)
+        scraper.save_results(results, args.output, args.output_format)
     else:
         # Show instructions
         print_instructions()
@@ -12,12 +12,51 @@ for summary and detailed results. This scraper accesses those endpoints directly
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import functools
+import gc
 import json
 import re
 import sys
 from datetime import datetime
 from typing import Dict, List, Optional
 
+from output_formats import OUTPUT_FORMATS, parquet_available, write_results
+
+try:
+    import orjson  # Optional: much faster JSON parsing
+except ImportError:
+    orjson = None
+
+# Field names Scytl has used for each value, in lookup priority order
+_CONTEST_NAME_KEYS = ('C', 'Contest', 'ContestName', 'Name')
+_CHOICES_KEYS = ('CH', 'Candidates', 'Choices')
+_CANDIDATE_NAME_KEYS = ('N', 'Candidate', 'Name', 'Choice')
+_VOTES_KEYS = ('V', 'Votes', 'VoteCount')
+_PERCENT_KEYS = ('P', 'Percent', 'Percentage')
+
+def _first_value(record: Dict, keys: tuple, default):
+    """Return the first truthy value among keys (the original or-chain)"""
+    for key in keys:
+        value = record.get(key)
+        if value:
+            return value
+    return default
+
+@functools.lru_cache(maxsize=4096)
+def _detect_party(contest_name: str) -> str:
+    """Cached party detection; contest names repeat across Scytl endpoints"""
+    contest_upper = contest_name.upper()
+    
+    # Scytl often includes party in contest name
+    if 'DEM ' in contest_upper or 'DEMOCRATIC' in contest_upper or '(D)' in contest_upper:
+        return 'Democratic'
+    elif 'REP ' in contest_upper or 'REPUBLICAN' in contest_upper or '(R)' in contest_upper:
+        return 'Republican'
+    else:
+        return 'Non-Partisan'
+
 class DuPageCountyScraper:
     """Scraper for DuPage County Scytl election results"""
     
@@ -35,6 +74,21 @@ class DuPageCountyScraper:
         
         self.election_id = election_id or 'UPDATE_ON_ELECTION_DAY'
         
+        # Reuse pooled, compressed connections (with retries) across polls
+        self.session = requests.Session()
+        self.session.headers.update({
+            'Accept-Encoding': 'gzip, deflate',
+            'User-Agent': 'il-election-results/1.0'
+        })
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         if self.election_id == 'UPDATE_ON_ELECTION_DAY':
             print("⚠️  WARNING: Election ID not set!")
             print("   On election day, visit: https://www.dupageresults.gov/IL/DuPage")
@@ -58,15 +112,7 @@ class DuPageCountyScraper:
         Returns:
             Party string: 'Democratic', 'Republican', or 'Non-Partisan'
         """
-        contest_upper = contest_name.upper()
-        
-        # Scytl often includes party in contest name
-        if 'DEM ' in contest_upper or 'DEMOCRATIC' in contest_upper or '(D)' in contest_upper:
-            return 'Democratic'
-        elif 'REP ' in contest_upper or 'REPUBLICAN' in contest_upper or '(R)' in contest_upper:
-            return 'Republican'
-        else:
-            return 'Non-Partisan'
+        return _detect_party(contest_name)
     
     def list_elections(self) -> List[Dict]:
         """List available elections from Scytl platform
@@ -78,34 +124,40 @@ class DuPageCountyScraper:
             # Try to fetch elections list (format may vary)
             elections_url = f"{self.base_url}/{self.state_code}/{self.county_code}/json/en/elections.json"
             
-            response = requests.get(elections_url, timeout=30)
+            response = self.session.get(elections_url, timeout=30)
             response.raise_for_status()
             
-            data = response.json()
+            data = self._decode_json(response)
             
             # Extract election info (structure varies)
-            elections = []
             if isinstance(data, list):
-                for item in data:
-                    elections.append({
-                        'id': item.get('ElectionID') or item.get('id'),
-                        'name': item.get('ElectionName') or item.get('name'),
-                        'date': item.get('Date') or item.get('date')
-                    })
-            elif isinstance(data, dict) and 'elections' in data:
-                for item in data['elections']:
-                    elections.append({
-                        'id': item.get('ElectionID') or item.get('id'),
-                        'name': item.get('ElectionName') or item.get('name'),
-                        'date': item.get('Date') or item.get('date')
-                    })
+                items = data
+            elif isinstance(data, dict):
+                items = data.get('elections', [])
+            else:
+                items = []
+            if not items:
+                return []
+            
+            # One feed uses one naming style; pick the keys from the first item
+            sample = items[0]
+            id_key = 'ElectionID' if 'ElectionID' in sample else 'id'
+            name_key = 'ElectionName' if 'ElectionName' in sample else 'name'
+            date_key = 'Date' if 'Date' in sample else 'date'
             
-            return elections
+            return [{'id': item.get(id_key), 'name': item.get(name_key), 'date': item.get(date_key)}
+                    for item in items]
             
         except Exception as e:
             print(f"Unable to fetch elections list: {e}")
             return []
     
+    def _decode_json(self, response: requests.Response):
+        """Decode a JSON response body, with orjson when available"""
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+    
     def scrape_summary(self) -> Dict:
         """Scrape summary results from Scytl platform
         
@@ -126,13 +178,13 @@ class DuPageCountyScraper:
         
         try:
             # Fetch summary results
-            response = requests.get(self.summary_url, timeout=30)
+            response = self.session.get(self.summary_url, timeout=30)
             response.raise_for_status()
             
-            data = response.json()
+            data = self._decode_json(response)
             
             # Parse Scytl summary format
-            results = self._parse_scytl_summary(data)
+            results = self._parse_scytl_summary(data, consume=True)
             results['county'] = self.county_name
             results['scraped_at'] = datetime.now().isoformat()
             results['source'] = 'Scytl summary JSON'
@@ -141,7 +193,7 @@ class DuPageCountyScraper:
             print(f"✓ Successfully scraped {len(results.get('contests', []))} contests")
             return results
             
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             print(f"✗ Error fetching results: {e}")
             return {
                 'error': str(e),
@@ -149,7 +201,7 @@ class DuPageCountyScraper:
                 'scraped_at': datetime.now().isoformat()
             }
     
-    def _parse_scytl_summary(self, data: Dict) -> Dict:
+    def _parse_scytl_summary(self, data: Dict, consume: bool = False) -> Dict:
         """Parse Scytl summary JSON format
         
         Scytl format typically includes:
@@ -159,6 +211,9 @@ class DuPageCountyScraper:
         
         Args:
             data: Raw JSON data from Scytl
+            consume: Empty data's contest list while parsing, so each raw
+                     contest is freed once normalized instead of the raw
+                     tree and the results both peaking at full size
             
         Returns:
             Normalized results dictionary
@@ -183,27 +238,81 @@ class DuPageCountyScraper:
         # Scytl can have contests at various levels in the JSON
         contests_data = data.get('Contests') or data.get('contests') or []
         
-        for contest in contests_data:
-            parsed_contest = self._parse_scytl_contest(contest)
-            if parsed_contest:
-                results['contests'].append(parsed_contest)
+        # The payload shape is fixed per feed, so resolve field names once
+        schema = self._detect_schema(contests_data)
+        
+        # Normalized contests are acyclic; skip cyclic GC passes while building them
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            if consume and isinstance(contests_data, list):
+                # Pop from the end of a reversed list to keep source order in O(1) per contest
+                contests_data.reverse()
+                pop = contests_data.pop
+                while contests_data:
+                    parsed_contest = self._parse_scytl_contest(pop(), schema)
+                    if parsed_contest:
+                        results['contests'].append(parsed_contest)
+            else:
+                for contest in contests_data:
+                    parsed_contest = self._parse_scytl_contest(contest, schema)
+                    if parsed_contest:
+                        results['contests'].append(parsed_contest)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
         
         return results
     
-    def _parse_scytl_contest(self, contest: Dict) -> Optional[Dict]:
+    def _detect_schema(self, contests: List[Dict]) -> Optional[tuple]:
+        """Detect which Scytl field names this payload uses
+        
+        Args:
+            contests: Contest dictionaries from Scytl JSON
+            
+        Returns:
+            (name_key, choices_key, cand_name_key, votes_key, percent_key),
+            or None if the first contest/candidate lacks any expected key
+        """
+        if not contests or not isinstance(contests[0], dict):
+            return None
+        
+        def pick(record, keys):
+            return next((key for key in keys if key in record), None)
+        
+        sample = contests[0]
+        name_key = pick(sample, _CONTEST_NAME_KEYS)
+        choices_key = pick(sample, _CHOICES_KEYS)
+        choices = sample.get(choices_key) if choices_key else None
+        if not choices or not isinstance(choices[0], dict):
+            return None
+        
+        candidate = choices[0]
+        schema = (name_key, choices_key,
+                  pick(candidate, _CANDIDATE_NAME_KEYS),
+                  pick(candidate, _VOTES_KEYS),
+                  pick(candidate, _PERCENT_KEYS))
+        return None if None in schema else schema
+    
+    def _parse_scytl_contest(self, contest: Dict,
+                             schema: Optional[tuple] = None) -> Optional[Dict]:
         """Parse a single contest from Scytl format
         
         Args:
             contest: Contest dictionary from Scytl JSON
+            schema: Field names from _detect_schema; falls back to trying
+                    every known field name when None or when a field is empty
             
         Returns:
             Normalized contest dictionary or None if invalid
         """
+        if schema is None:
+            schema = (None,) * 5
+        name_key, choices_key, cand_name_key, votes_key, percent_key = schema
+        
         # Extract contest name (various possible keys)
-        contest_name = (contest.get('C') or 
-                       contest.get('Contest') or 
-                       contest.get('ContestName') or
-                       contest.get('Name') or '')
+        contest_name = (contest.get(name_key) or
+                        _first_value(contest, _CONTEST_NAME_KEYS, ''))
         
         if not contest_name:
             return None
@@ -216,24 +325,19 @@ class DuPageCountyScraper:
         
         # Extract candidates/choices
         # Scytl uses various field names
-        candidates_data = (contest.get('CH') or  # Choices
-                          contest.get('Candidates') or
-                          contest.get('Choices') or [])
+        candidates_data = (contest.get(choices_key) or
+                           _first_value(contest, _CHOICES_KEYS, []))
         
         for candidate in candidates_data:
             # Extract candidate info (field names vary)
-            name = (candidate.get('N') or 
-                   candidate.get('Candidate') or
-                   candidate.get('Name') or 
-                   candidate.get('Choice') or '')
+            name = (candidate.get(cand_name_key) or
+                    _first_value(candidate, _CANDIDATE_NAME_KEYS, ''))
             
-            votes = (candidate.get('V') or 
-                    candidate.get('Votes') or
-                    candidate.get('VoteCount') or 0)
+            votes = (candidate.get(votes_key) or
+                     _first_value(candidate, _VOTES_KEYS, 0))
             
-            percent = (candidate.get('P') or
-                      candidate.get('Percent') or
-                      candidate.get('Percentage') or 0.0)
+            percent = (candidate.get(percent_key) or
+                       _first_value(candidate, _PERCENT_KEYS, 0.0))
             
             # Convert votes to int if string
             if isinstance(votes, str):
@@ -252,18 +356,15 @@ class DuPageCountyScraper:
         
         return parsed if parsed['candidates'] else None
     
-    def save_results(self, results: Dict, output_dir: str = '.'):
-        """Save results to JSON file
+    def save_results(self, results: Dict, output_dir: str = '.', output_format: str = 'json'):
+        """Save results to disk
         
         Args:
             results: Results dictionary
             output_dir: Directory to save file
+            output_format: 'json', 'jsonl' or 'parquet' (see output_formats)
         """
-        filename = f"{output_dir}/dupage_results.json"
-        
-        with open(filename, 'w') as f:
-            json.dump(results, f, indent=2)
-        
+        filename = write_results(results, f"{output_dir}/dupage_results", output_format)
         print(f"✓ Saved results to {filename}")
 
 def print_instructions():
@@ -308,8 +409,12 @@ def main():
                        help='List available elections')
     parser.add_argument('--output', default='.', 
                        help='Output directory for JSON results')
+    parser.add_argument('--format', dest='output_format', choices=OUTPUT_FORMATS, default='json',
+                       help='Output format: indented JSON, JSON Lines, or Parquet (needs pyarrow)')
     
     args = parser.parse_args()
+    if args.output_format == 'parquet' and not parquet_available():
+        parser.error('--format parquet needs pyarrow (pip install pyarrow)')
     
     if args.list:
         # List available elections
@@ -331,7 +436,7 @@ def main():
         # Scrape with provided election ID
         scraper = DuPageCountyScraper(args.election_id)
         results = scraper.scrape_summary()
-        scraper.save_results(results, args.output)
+        scraper.save_results(results, args.output, args.output_format)
     else:
         # Show instructions
         print_instructions()
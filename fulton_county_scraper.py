@@ -11,11 +11,122 @@ Fulton posts clean "Cumulative Results Report" PDFs with structured formatting.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import functools
 import json
+import os
 import re
+import tempfile
 from datetime import datetime
-from typing import Dict, List, Optional
-import pdfplumber
+from typing import Dict, List, Optional, Tuple
+
+# PyMuPDF extracts text natively and much faster; pdfplumber is the fallback
+try:
+    import pymupdf
+except ImportError:
+    try:
+        import fitz as pymupdf  # Older PyMuPDF releases
+    except ImportError:
+        pymupdf = None
+
+if pymupdf is None:
+    import pdfplumber
+
+try:
+    import orjson  # Optional: much faster JSON encoding
+except ImportError:
+    orjson = None
+
+# Bytes per chunk when streaming the results PDF to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Report patterns, compiled once for the per-line parse loop
+_X_OF_Y_RE = re.compile(r'(\d+) of (\d+)')
+_VOTE_FOR_RE = re.compile(r'\(Vote for (.*?)\)')
+_NUMBER_RE = re.compile(r'(\d+)')
+
+def _words_to_text(words: List[Tuple], y_tolerance: float = 3) -> str:
+    """Rebuild page text from PyMuPDF words, one line per row of words
+    
+    PyMuPDF's plain text mode puts widely spaced table columns on separate
+    lines, so rows are rebuilt from word positions to match the
+    one-row-per-line layout the report parser expects.
+    
+    Args:
+        words: Tuples from page.get_text('words'): (x0, y0, x1, y1, text, ...)
+        y_tolerance: Vertical distance within which words share a line
+        
+    Returns:
+        Page text with one line per row of words
+    """
+    lines = []
+    row = []
+    row_top = None
+    for word in sorted(words, key=lambda w: w[1]):
+        if row_top is not None and word[1] - row_top > y_tolerance:
+            lines.append(' '.join(w[4] for w in sorted(row)))
+            row = []
+            row_top = None
+        if row_top is None:
+            row_top = word[1]
+        row.append(word)
+    if row:
+        lines.append(' '.join(w[4] for w in sorted(row)))
+    return '\n'.join(lines)
+
+@functools.lru_cache(maxsize=4096)
+def _detect_party(contest_name: str, candidate_text: str = '') -> Optional[str]:
+    """Cached party detection from contest or candidate text"""
+    # Check contest name for party suffix
+    if ' - REPUBLICAN PARTY' in contest_name or ' - REPUBLICAN' in contest_name:
+        return 'Republican'
+    elif ' - DEMOCRATIC PARTY' in contest_name or ' - DEMOCRATIC' in contest_name:
+        return 'Democratic'
+    elif 'NONPARTISAN' in contest_name.upper():
+        return 'Non-Partisan'
+    
+    # Check candidate text (upper-cased once for both party words)
+    if not candidate_text:
+        return None
+    candidate_upper = candidate_text.upper()
+    if '(REP)' in candidate_text or 'REPUBLICAN' in candidate_upper:
+        return 'Republican'
+    elif '(DEM)' in candidate_text or 'DEMOCRATIC' in candidate_upper:
+        return 'Democratic'
+    
+    return None
+
+def _scan_totals(parts: List[str]) -> Tuple[Optional[int], Optional[int], Optional[float]]:
+    """Find the total votes and total percent at the end of a candidate row
+    
+    Scans backward for the last percentage, then the vote count before it.
+    
+    Args:
+        parts: Whitespace-split tokens of the row
+        
+    Returns:
+        (index of the votes token, total votes, total percent); the first two
+        are None when no vote count precedes a percentage
+    """
+    total_percent = None
+    for j in range(len(parts) - 1, -1, -1):
+        part = parts[j]
+        # Check for percentage
+        if total_percent is None:
+            if '%' in part:
+                try:
+                    total_percent = float(part.replace('%', ''))
+                except ValueError:
+                    pass
+        # Check for votes (before percentage)
+        elif '%' not in part:
+            try:
+                return j, int(part.replace(',', '')), total_percent
+            except ValueError:
+                pass
+    return None, None, total_percent
+
 
 class FultonCountyScraper:
     """Scraper for Fulton County Cumulative Results Report PDFs"""
@@ -25,24 +136,22 @@ class FultonCountyScraper:
         self.election_date = election_date
         self.base_url = 'https://fultoncountyilelections.gov'
         self.results_page = f'{self.base_url}/election-results/'
+        
+        # Reuse pooled, compressed connections (with retries) across requests
+        self.session = requests.Session()
+        self.session.headers.update({
+            'Accept-Encoding': 'gzip, deflate'
+        })
+        adapter = HTTPAdapter(
+            max_retries=Retry(total=3, backoff_factor=0.5,
+                              status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
     def detect_party(self, contest_name: str, candidate_text: str = '') -> Optional[str]:
         """Detect party from contest or candidate text"""
-        # Check contest name for party suffix
-        if ' - REPUBLICAN PARTY' in contest_name or ' - REPUBLICAN' in contest_name:
-            return 'Republican'
-        elif ' - DEMOCRATIC PARTY' in contest_name or ' - DEMOCRATIC' in contest_name:
-            return 'Democratic'
-        elif 'NONPARTISAN' in contest_name.upper():
-            return 'Non-Partisan'
-        
-        # Check candidate text
-        if '(REP)' in candidate_text or 'REPUBLICAN' in candidate_text.upper():
-            return 'Republican'
-        elif '(DEM)' in candidate_text or 'DEMOCRATIC' in candidate_text.upper():
-            return 'Democratic'
-        
-        return None
+        return _detect_party(contest_name, candidate_text)
     
     def scrape_from_pdf_url(self, pdf_url: str) -> Dict:
         """Scrape results from Fulton County PDF"""
@@ -50,14 +159,20 @@ class FultonCountyScraper:
         print(f"PDF URL: {pdf_url}")
         
         try:
-            response = requests.get(pdf_url, timeout=60)
-            response.raise_for_status()
-            
-            temp_pdf = '/tmp/fulton_results.pdf'
-            with open(temp_pdf, 'wb') as f:
-                f.write(response.content)
+            # Stream the PDF straight to a private temp file instead of holding it in memory
+            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as f:
+                temp_pdf = f.name
+            try:
+                with self.session.get(pdf_url, timeout=60, stream=True) as response:
+                    response.raise_for_status()
+                    with open(temp_pdf, 'wb') as f:
+                        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                
+                text = self._extract_pdf_text(temp_pdf)
+            finally:
+                os.remove(temp_pdf)
             
-            text = self._extract_pdf_text(temp_pdf)
             results = self._parse_cumulative_report(text)
             
             results['county'] = self.county_name
@@ -78,11 +193,20 @@ class FultonCountyScraper:
             }
     
     def _extract_pdf_text(self, pdf_path: str) -> str:
-        """Extract text from PDF"""
+        """Extract text from PDF, with PyMuPDF when installed"""
+        if pymupdf is not None:
+            doc = pymupdf.open(pdf_path)
+            try:
+                return '\n'.join(_words_to_text(page.get_text('words')) for page in doc)
+            finally:
+                doc.close()
+        
         text_parts = []
         with pdfplumber.open(pdf_path) as pdf:
             for page in pdf.pages:
                 text_parts.append(page.extract_text())
+                # pdf.pages keeps every Page alive; drop its parsed layout now
+                page.flush_cache()
         return '\n'.join(text_parts)
     
     def _parse_cumulative_report(self, text: str) -> Dict:
@@ -110,46 +234,56 @@ class FultonCountyScraper:
         """
         results = {'contests': [], 'summary': {}, 'metadata': {}}
         
-        lines = text.split('\n')
+        # Strip once up front; blank lines never affect the parse
+        lines = [line for line in (raw.strip() for raw in text.splitlines()) if line]
         
-        # Extract metadata
-        for i, line in enumerate(lines[:50]):
-            if 'Registered Voters' in line and 'of' in line:
-                match = re.search(r'(\d+) of (\d+)', line)
+        # Extract metadata (both lines sit in the report preamble)
+        metadata = results['metadata']
+        for line in lines[:50]:
+            if 'of' not in line:
+                continue
+            
+            if 'Registered Voters' in line:
+                match = _X_OF_Y_RE.search(line)
                 if match:
-                    results['metadata']['ballots_cast'] = int(match.group(1))
-                    results['metadata']['registered_voters'] = int(match.group(2))
+                    metadata['ballots_cast'] = int(match.group(1))
+                    metadata['registered_voters'] = int(match.group(2))
             
-            if 'Precincts Reporting' in line and 'of' in line:
-                match = re.search(r'(\d+) of (\d+)', line)
+            if 'Precincts Reporting' in line:
+                match = _X_OF_Y_RE.search(line)
                 if match:
-                    results['metadata']['precincts_reporting'] = int(match.group(1))
-                    results['metadata']['total_precincts'] = int(match.group(2))
+                    metadata['precincts_reporting'] = int(match.group(1))
+                    metadata['total_precincts'] = int(match.group(2))
+            
+            # Stop at the first match of each instead of rescanning the preamble
+            if 'ballots_cast' in metadata and 'precincts_reporting' in metadata:
+                break
         
         # Parse contests
         current_contest = None
+        candidates = []  # current_contest['candidates'], bound once per contest
         in_candidate_section = False
         
         i = 0
         while i < len(lines):
-            line = lines[i].strip()
+            line = lines[i]
             
             # Check for contest header
             if line.startswith('FOR ') and (' - ' in line or '(' in line):
                 # Save previous contest
-                if current_contest and current_contest.get('candidates'):
+                if current_contest and candidates:
                     results['contests'].append(current_contest)
                 
                 # Extract contest name and party
                 contest_name = line.replace('FOR ', '').strip()
                 
                 # Clean up vote-for notation
-                vote_for_match = re.search(r'\(Vote for (.*?)\)', contest_name)
+                vote_for_match = _VOTE_FOR_RE.search(contest_name)
                 vote_for = 1
                 if vote_for_match:
                     vote_for_text = vote_for_match.group(1).lower()
                     if 'not more than' in vote_for_text:
-                        vote_for = int(re.search(r'(\d+)', vote_for_text).group(1))
+                        vote_for = int(_NUMBER_RE.search(vote_for_text).group(1))
                     elif vote_for_text != 'one':
                         try:
                             vote_for = int(vote_for_text)
@@ -159,11 +293,12 @@ class FultonCountyScraper:
                 
                 party = self.detect_party(contest_name)
                 
+                candidates = []
                 current_contest = {
                     'name': contest_name,
                     'party': party or 'Non-Partisan',
                     'vote_for': vote_for,
-                    'candidates': []
+                    'candidates': candidates
                 }
                 in_candidate_section = False
                 i += 1
@@ -176,7 +311,7 @@ class FultonCountyScraper:
                 continue
             
             # Parse candidate lines
-            if current_contest and in_candidate_section and line:
+            if current_contest and in_candidate_section:
                 # Skip metadata lines
                 if ('Precincts' in line or 'Counted' in line or 'Voters' in line or 
                     'Ballots' in line or 'Cast Votes' in line or 'Undervotes' in line or 
@@ -192,38 +327,14 @@ class FultonCountyScraper:
                 parts = line.split()
                 
                 if len(parts) >= 2:
-                    # Find the last percentage (total %)
-                    total_percent = None
-                    total_votes = None
-                    
-                    for j in range(len(parts) - 1, -1, -1):
-                        part = parts[j]
-                        # Check for percentage
-                        if '%' in part and total_percent is None:
-                            try:
-                                total_percent = float(part.replace('%', ''))
-                            except:
-                                pass
-                        # Check for votes (before percentage)
-                        elif total_percent is not None and total_votes is None:
-                            try:
-                                total_votes = int(part.replace(',', ''))
-                                break
-                            except:
-                                pass
+                    votes_idx, total_votes, total_percent = _scan_totals(parts)
                     
                     if total_votes is not None:
                         # Everything before votes is candidate name
-                        name_parts = []
-                        for j in range(len(parts)):
-                            if parts[j] == str(total_votes) or (parts[j].replace(',', '') == str(total_votes)):
-                                break
-                            name_parts.append(parts[j])
-                        
-                        candidate_name = ' '.join(name_parts)
+                        candidate_name = ' '.join(parts[:votes_idx])
                         
                         if candidate_name and not candidate_name.startswith('No Candidate'):
-                            current_contest['candidates'].append({
+                            candidates.append({
                                 'name': candidate_name,
                                 'votes': total_votes,
                                 'percent': total_percent if total_percent else 0
@@ -232,16 +343,18 @@ class FultonCountyScraper:
             i += 1
         
         # Add last contest
-        if current_contest and current_contest.get('candidates'):
+        if current_contest and candidates:
             results['contests'].append(current_contest)
         
-        # Calculate missing percentages
+        # Calculate missing percentages (to 2 decimals, rounding half up in integer math)
         for contest in results['contests']:
-            total_votes = sum(c['votes'] for c in contest['candidates'])
+            candidates = contest['candidates']
+            total_votes = sum(c['votes'] for c in candidates)
             if total_votes > 0:
-                for candidate in contest['candidates']:
+                half = total_votes // 2
+                for candidate in candidates:
                     if candidate['percent'] == 0:
-                        candidate['percent'] = round(candidate['votes'] / total_votes * 100, 2)
+                        candidate['percent'] = (candidate['votes'] * 10000 + half) // total_votes / 100
         
         return results
     
@@ -266,8 +379,12 @@ class FultonCountyScraper:
     def save_results(self, results: Dict, output_dir: str = '.'):
         """Save results to JSON file"""
         filename = f"{output_dir}/fulton_county_results.json"
-        with open(filename, 'w') as f:
-            json.dump(results, f, indent=2)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(results, f, indent=2)
         print(f"✓ Saved results to {filename}")
 
 def main():
@@ -14,12 +14,51 @@ which is much simpler to parse than JavaScript-heavy platforms.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import functools
 import json
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional
 
+try:
+    import orjson  # Optional: much faster JSON encoding
+except ImportError:
+    orjson = None
+
+# Upper bound on counties fetched at once (each county is a separate host)
+MAX_COUNTY_WORKERS = 8
+
+# Results-text patterns, compiled once for the per-line parse loop
+_PRECINCTS_COUNTED_RE = re.compile(r'(\d+)\s+100')
+_NUMBER_RE = re.compile(r'(\d+)')
+_SEATS_RE = re.compile(r'VOTE FOR NO MORE THAN (\d+)')
+_DIGITS_RE = re.compile(r'\d+')
+_PARTY_RE = re.compile(r'\(([^)]+)\)')
+_PARTY_STRIP_RE = re.compile(r'\s*\([^)]+\)\s*')
+
+# Summary lines: (keyword, number pattern, summary field), checked in order and
+# first match wins. Plain substring tests beat one alternation regex here.
+_SUMMARY_FIELDS = (
+    ('PRECINCTS COUNTED', _PRECINCTS_COUNTED_RE, 'precincts_counted'),
+    ('REGISTERED VOTERS', _NUMBER_RE, 'registered_voters'),
+    ('BALLOTS CAST - TOTAL', _NUMBER_RE, 'ballots_cast'),
+    ('VOTER TURNOUT', _NUMBER_RE, 'turnout_percent'),
+)
+
+@functools.lru_cache(maxsize=4096)
+def _detect_party(contest_upper: str) -> str:
+    """Cached party detection, keyed on the upper-cased contest name"""
+    if 'DEMOCRATIC' in contest_upper or 'DEM ' in contest_upper:
+        return 'Democratic'
+    elif 'REPUBLICAN' in contest_upper or 'REP ' in contest_upper:
+        return 'Republican'
+    else:
+        return 'Non-Partisan'
+
 class IntegraElectionScraper:
     """Scraper for Integra Election Reporting Console platform"""
     
@@ -54,23 +93,31 @@ class IntegraElectionScraper:
         self.base_url = config['base_url']
         self.text_url = f"{self.base_url}/electiontext.php"
         
-    def detect_party(self, contest_name: str) -> str:
+        # Reuse pooled, compressed connections (with retries) across requests
+        self.session = requests.Session()
+        self.session.headers.update({
+            'Accept-Encoding': 'gzip, deflate'
+        })
+        adapter = HTTPAdapter(
+            max_retries=Retry(total=3, backoff_factor=0.5,
+                              status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+    def detect_party(self, contest_name: str, contest_upper: Optional[str] = None) -> str:
         """Detect party affiliation from contest name
         
         Args:
             contest_name: Name of the contest
+            contest_upper: contest_name.upper(), if the caller already has it
             
         Returns:
             Party string: 'Democratic', 'Republican', or 'Non-Partisan'
         """
-        contest_upper = contest_name.upper()
-        
-        if 'DEMOCRATIC' in contest_upper or 'DEM ' in contest_upper:
-            return 'Democratic'
-        elif 'REPUBLICAN' in contest_upper or 'REP ' in contest_upper:
-            return 'Republican'
-        else:
-            return 'Non-Partisan'
+        if contest_upper is None:
+            contest_upper = contest_name.upper()
+        return _detect_party(contest_upper)
     
     def parse_text_results(self, text_content: str) -> Dict:
         """Parse plain text election results
@@ -88,51 +135,43 @@ class IntegraElectionScraper:
             'scraped_at': datetime.now().isoformat()
         }
         
-        lines = text_content.strip().split('\n')
+        # Strip once up front, dropping blank lines and markdown fences
+        lines = [line for line in (raw.strip() for raw in text_content.splitlines())
+                 if line and line != '```']
+        summary = results['summary']
         current_contest = None
+        candidates = []  # current_contest['candidates'], bound once per contest
         
         for line in lines:
-            line = line.strip()
-            
-            # Skip empty lines
-            if not line or line == '```':
-                continue
-            
             # Extract summary information
-            if 'PRECINCTS COUNTED' in line:
-                match = re.search(r'(\d+)\s+100', line)
-                if match:
-                    results['summary']['precincts_counted'] = int(match.group(1))
-            elif 'REGISTERED VOTERS' in line:
-                match = re.search(r'(\d+)', line)
-                if match:
-                    results['summary']['registered_voters'] = int(match.group(1))
-            elif 'BALLOTS CAST - TOTAL' in line:
-                match = re.search(r'(\d+)', line)
-                if match:
-                    results['summary']['ballots_cast'] = int(match.group(1))
-            elif 'VOTER TURNOUT' in line:
-                match = re.search(r'(\d+)', line)
-                if match:
-                    results['summary']['turnout_percent'] = int(match.group(1))
+            for keyword, pattern, field in _SUMMARY_FIELDS:
+                if keyword in line:
+                    match = pattern.search(line)
+                    if match:
+                        summary[field] = int(match.group(1))
+                    break
             
-            # Detect contest headers (all caps, no leading dots)
+            # Detect contest headers (all caps, no leading dots). isupper() is a
+            # single allocation-free pass, and unlike line == line.upper() it
+            # rejects lines with no letters at all (fences, bare numbers)
             if line.isupper() and not line.startswith('.') and 'VOTE FOR' not in line:
                 # Save previous contest
-                if current_contest and current_contest.get('candidates'):
+                if current_contest and candidates:
                     results['contests'].append(current_contest)
                 
                 # Start new contest
+                candidates = []
                 current_contest = {
                     'name': line,
-                    'party': self.detect_party(line),
-                    'candidates': []
+                    # An isupper() line is already its own upper-case form
+                    'party': self.detect_party(line, line),
+                    'candidates': candidates
                 }
             
             # Detect "VOTE FOR NO MORE THAN X"
             elif 'VOTE FOR NO MORE THAN' in line:
                 if current_contest:
-                    match = re.search(r'VOTE FOR NO MORE THAN (\d+)', line)
+                    match = _SEATS_RE.search(line)
                     if match:
                         current_contest['seats'] = int(match.group(1))
             
@@ -146,20 +185,20 @@ class IntegraElectionScraper:
                     
                     # Right side: votes and percent
                     vote_part = parts[-1].strip()
-                    vote_match = re.findall(r'\d+', vote_part)
+                    vote_match = _DIGITS_RE.findall(vote_part)
                     
                     # Extract party from name (appears in parentheses)
-                    party_match = re.search(r'\(([^)]+)\)', name_part)
+                    party_match = _PARTY_RE.search(name_part)
                     candidate_party = party_match.group(1) if party_match else 'UNK'
                     
                     # Remove party from name
-                    candidate_name = re.sub(r'\s*\([^)]+\)\s*', '', name_part).strip()
+                    candidate_name = _PARTY_STRIP_RE.sub('', name_part).strip()
                     
                     if vote_match:
                         votes = int(vote_match[0])
                         percent = float(vote_match[1]) if len(vote_match) > 1 else 0.0
                         
-                        current_contest['candidates'].append({
+                        candidates.append({
                             'name': candidate_name,
                             'party': candidate_party,
                             'votes': votes,
@@ -167,7 +206,7 @@ class IntegraElectionScraper:
                         })
         
         # Add the last contest
-        if current_contest and current_contest.get('candidates'):
+        if current_contest and candidates:
             results['contests'].append(current_contest)
         
         return results
@@ -183,7 +222,7 @@ class IntegraElectionScraper:
         
         try:
             # Fetch the plain text results
-            response = requests.get(self.text_url, timeout=30)
+            response = self.session.get(self.text_url, timeout=30)
             response.raise_for_status()
             
             # Parse the results
@@ -209,8 +248,12 @@ class IntegraElectionScraper:
         """
         filename = f"{output_dir}/{self.county_key.lower()}_results.json"
         
-        with open(filename, 'w') as f:
-            json.dump(results, f, indent=2)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(results, f, indent=2)
         
         print(f"✓ Saved results to {filename}")
 
@@ -230,11 +273,19 @@ def scrape_all_integra_counties(output_dir: str = '.'):
     print(f"Scraping {len(counties)} counties: {', '.join(counties)}")
     print()
     
-    for county_key in counties:
-        scraper = IntegraElectionScraper(county_key)
-        results = scraper.scrape()
-        scraper.save_results(results, output_dir)
-        print()
+    # Counties are independent network-bound fetches, so overlap them
+    with ThreadPoolExecutor(max_workers=min(MAX_COUNTY_WORKERS, len(counties))) as executor:
+        futures = [executor.submit(_scrape_one, county_key, output_dir) for county_key in counties]
+        # Surface the first failure in county order, as the serial loop did
+        for future in futures:
+            future.result()
+    print()
+
+def _scrape_one(county_key: str, output_dir: str):
+    """Scrape and save a single Integra county"""
+    scraper = IntegraElectionScraper(county_key)
+    results = scraper.scrape()
+    scraper.save_results(results, output_dir)
 
 def main():
     """Main entry point"""
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Result file writers shared by the scrapers' --format option
+
+json writes the whole results dictionary as one indented document. jsonl
+(one contest per line) and parquet (one row per candidate) write the
+contests, plus a .summary.json sidecar holding everything else.
+"""
+
+import importlib.util
+import json
+from typing import Dict, List
+
+try:
+    import orjson  # Optional: much faster JSON encoding
+except ImportError:
+    orjson = None
+
+# Output formats supported by write_results / --format
+OUTPUT_FORMATS = ('json', 'jsonl', 'parquet')
+
+def parquet_available() -> bool:
+    """True if pyarrow is installed, so parquet output can be written"""
+    return importlib.util.find_spec('pyarrow') is not None
+
+def _write_json(filename: str, obj, indent: bool = True):
+    """Write obj as JSON, with orjson when available"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(obj, option=option))
+    else:
+        with open(filename, 'w') as f:
+            json.dump(obj, f, indent=2 if indent else None)
+
+def _write_jsonl(filename: str, contests: List[Dict]):
+    """Write one compact JSON contest per line"""
+    if orjson is not None:
+        with open(filename, 'wb') as f:
+            for contest in contests:
+                f.write(orjson.dumps(contest, option=orjson.OPT_NON_STR_KEYS))
+                f.write(b'\n')
+    else:
+        with open(filename, 'w') as f:
+            for contest in contests:
+                f.write(json.dumps(contest))
+                f.write('\n')
+
+def _write_parquet(filename: str, contests: List[Dict]):
+    """Write one row per candidate to a zstd Parquet file (needs pyarrow)"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    columns = {'contest': [], 'party': [], 'candidate': [], 'votes': [], 'percent': []}
+    for contest in contests:
+        for candidate in contest.get('candidates', []):
+            columns['contest'].append(contest.get('name'))
+            columns['party'].append(contest.get('party'))
+            columns['candidate'].append(candidate.get('name'))
+            columns['votes'].append(candidate.get('votes'))
+            columns['percent'].append(candidate.get('percent'))
+    
+    schema = pa.schema([('contest', pa.string()), ('party', pa.string()),
+                        ('candidate', pa.string()), ('votes', pa.int64()),
+                        ('percent', pa.float64())])
+    pq.write_table(pa.Table.from_pydict(columns, schema=schema), filename, compression='zstd')
+
+def write_results(results: Dict, basename: str, output_format: str = 'json') -> str:
+    """Write scraper results in the given format
+    
+    Args:
+        results: Results dictionary with a 'contests' list
+        basename: Output path without extension
+        output_format: One of OUTPUT_FORMATS
+    
+    Returns:
+        Path of the main file written
+    
+    Raises:
+        ValueError: Unknown output format
+        ImportError: parquet requested without pyarrow installed
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format: {output_format}")
+    
+    filename = f"{basename}.{output_format}"
+    
+    if output_format == 'json':
+        _write_json(filename, results)
+        return filename
+    
+    contests = results.get('contests', [])
+    if output_format == 'parquet':
+        _write_parquet(filename, contests)
+    else:
+        _write_jsonl(filename, contests)
+    
+    summary = {key: value for key, value in results.items() if key != 'contests'}
+    _write_json(f"{basename}.summary.json", summary)
+    return filename
@@ -336,15 +336,13 @@ def run_lasalle(log: Logger) -> bool:
 def run_aggregator(push: bool, log: Logger) -> bool:
     """Run the aggregator and optionally push to GitHub. Returns True on success."""
     try:
-        from aggregate_results import MultiCountyAggregator, git_push
-        import json as _json
+        from aggregate_results import MultiCountyAggregator, git_push, save_results
 
         log.info("Aggregating county results...")
         agg = MultiCountyAggregator(results_dir=RESULTS_DIR)
-        results = agg.aggregate()
+        results = agg.aggregate(output_file=OUTPUT_FILE)
 
-        with open(OUTPUT_FILE, "w") as f:
-            _json.dump(results, f, indent=2)
+        save_results(results, OUTPUT_FILE)
 
         n = results.get("num_counties", 0)
         log.success(f"Aggregation complete: {n} counties → {OUTPUT_FILE}")
@@ -0,0 +1,35 @@
+"""Champaign party detection keeps its check order
+
+Democratic is tested before Republican, and explicit markers before party
+words, regardless of where each appears in the name.
+"""
+
+import pytest
+
+from champaign_county_scraper import ChampaignCountyScraper
+
+
+@pytest.mark.parametrize('sheet_name, party', [
+    ('DEM', 'Democratic'),
+    ('Summary Report - DEM', 'Democratic'),
+    ('Representative (DEM)', 'Democratic'),
+    ('Rep Ballot', 'Republican'),
+    ('NONPARTISAN', 'Non-Partisan'),
+    ('Sheet1', 'Unknown'),
+])
+def test_sheet_party(sheet_name, party):
+    assert ChampaignCountyScraper()._detect_party_from_sheet(sheet_name) == party
+
+
+@pytest.mark.parametrize('contest_name, party', [
+    ('Representative in Congress (DEM)', 'Democratic'),
+    ('Representative in Congress (REP)', 'Republican'),
+    ('Committeeperson (REP) / (DEM)', 'Democratic'),
+    ('Republican Party Delegate (Democratic)', 'Democratic'),
+    ('Republican Party Delegate (DEM)', 'Democratic'),
+    ('Democratic Party Delegate (REP)', 'Republican'),
+    ('Republican State Central Committeeman', 'Republican'),
+    ('Urbana School District 116', 'Non-Partisan'),
+])
+def test_contest_party(contest_name, party):
+    assert ChampaignCountyScraper().detect_party(contest_name) == party
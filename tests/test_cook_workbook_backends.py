@@ -0,0 +1,91 @@
+"""Cook County workbook readers must parse the same contests
+
+python-calamine is used when installed and openpyxl otherwise, so each
+sheet layout is parsed through both and compared.
+"""
+
+import zipfile
+
+import openpyxl
+import pytest
+
+import cook_county_scraper
+from cook_county_scraper import CookCountyClerkScraper
+
+BACKENDS = ['openpyxl']
+if cook_county_scraper.CalamineWorkbook is not None:
+    BACKENDS.append('calamine')
+
+# Sheets as {cell: value}; A1-style keys so empty leading rows/columns are explicit
+SHEETS = {
+    'Column A': {
+        'A1': 'DEM PRESIDENT OF THE UNITED STATES',
+        'A2': 'Joseph R. Biden', 'B2': 234567, 'C2': 65.4,
+        'A3': 'Uncommitted', 'B3': '124,123', 'C3': '34.6%',
+        'A4': 'TOTAL', 'B4': 358690,
+        'A6': 'REP COUNTY BOARD COMMISSIONER DISTRICT 12',
+        'A7': 12, 'B7': 4567,
+        'A8': 'Jane Doe', 'B8': None, 'C8': 45.6, 'D8': 1234,
+    },
+    'Empty column A': {
+        'B2': 'DEM PRESIDENT OF THE UNITED STATES',
+        'B3': 'Joseph R. Biden', 'C3': 234567, 'D3': 65.4,
+    },
+    'Leading empty rows': {
+        'A4': 'REP STATE SENATOR 7TH DISTRICT',
+        'A5': 'John Smith', 'B5': 9876, 'C5': 51.2,
+        'A6': 'Mary Jones', 'B6': 9412, 'C6': 48.8,
+    },
+}
+
+
+@pytest.fixture
+def canvass_zip(tmp_path):
+    workbook = openpyxl.Workbook()
+    workbook.remove(workbook.active)
+    for sheet_name, cells in SHEETS.items():
+        sheet = workbook.create_sheet(sheet_name)
+        for ref, value in cells.items():
+            sheet[ref] = value
+    workbook_path = tmp_path / 'canvass.xlsx'
+    workbook.save(workbook_path)
+
+    zip_path = tmp_path / 'canvass.zip'
+    with zipfile.ZipFile(zip_path, 'w') as archive:
+        archive.write(workbook_path, 'canvass.xlsx')
+    return str(zip_path)
+
+
+def parse_with(backend, zip_path, monkeypatch):
+    if backend == 'openpyxl':
+        monkeypatch.setattr(cook_county_scraper, 'CalamineWorkbook', None)
+    scraper = CookCountyClerkScraper('0326')
+    results = scraper.parse_excel_from_zip(zip_path, use_cache=False)
+    monkeypatch.undo()
+    assert 'error' not in results
+    return results['contests']
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_backends_match_openpyxl(backend, canvass_zip, monkeypatch):
+    expected = parse_with('openpyxl', canvass_zip, monkeypatch)
+    assert parse_with(backend, canvass_zip, monkeypatch) == expected
+
+
+def test_openpyxl_contests(canvass_zip, monkeypatch):
+    contests = parse_with('openpyxl', canvass_zip, monkeypatch)
+
+    # Nothing is read from sheets whose first column is empty
+    assert {contest['sheet'] for contest in contests} == {'Column A', 'Leading empty rows'}
+
+    president, commissioner, senator = contests
+    assert president['candidates'] == [
+        {'name': 'Joseph R. Biden', 'votes': 234567, 'percent': 65.4},
+        {'name': 'Uncommitted', 'votes': 124123, 'percent': 34.6},
+    ]
+    # Integer first cells read as '12', and percents are never taken as votes
+    assert commissioner['candidates'] == [
+        {'name': '12', 'votes': 4567, 'percent': 0.0},
+        {'name': 'Jane Doe', 'votes': 1234, 'percent': 45.6},
+    ]
+    assert senator['party'] == 'Republican'
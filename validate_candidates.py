@@ -27,6 +27,7 @@ import sys
 import argparse
 import os
 from pathlib import Path
+from urllib.parse import urljoin
 from typing import Dict, List, Set, Tuple, Optional
 
 try:
@@ -177,6 +178,23 @@ def load_local_json(path: str) -> Optional[dict]:
         print(f"❌ Failed to load {path}: {e}")
         return None
 
+def load_county_files(data: dict, source: str, from_url: bool) -> dict:
+    """
+    Replace county file references with the county data they point to.
+    The aggregator references each county's JSON file (relative to the
+    statewide JSON) unless it was run with --embed-counties.
+    """
+    for county, county_data in data.get('county_results', {}).items():
+        if 'file' not in county_data:
+            continue
+        if from_url:
+            loaded = fetch_json(urljoin(source, county_data['file']))
+        else:
+            loaded = load_local_json(str(Path(source).parent / county_data['file']))
+        if loaded:
+            data['county_results'][county] = loaded
+    return data
+
 # ── Main validation ───────────────────────────────────────────────────────────
 
 def validate(widgets_dir: str, json_data: dict) -> bool:
@@ -284,6 +302,9 @@ Examples:
     if not json_data:
         sys.exit(1)
 
+    json_data = load_county_files(json_data, args.local_json or args.json_url,
+                                  from_url=not args.local_json)
+
     print(f"JSON loaded — counties: {', '.join(json_data.get('counties_included', ['?']))}\n")
 
     # Validate